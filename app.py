@@ -1,19 +1,24 @@
 """Flask application for diminumero."""
 
+import gzip
+import hashlib
 import json
+from collections.abc import Mapping
 from datetime import datetime, timezone
-from functools import wraps
+from functools import cache, lru_cache, wraps
 from urllib.parse import quote_plus, urlencode
 
 from flask import (
     Flask,
     Response,
+    abort,
     render_template,
     request,
     redirect,
     url_for,
     session,
     flash,
+    g,
     jsonify,
 )
 from authlib.integrations.base_client.errors import OAuthError
@@ -31,6 +36,7 @@ import secrets
 import sys
 import time
 from pathlib import Path
+from types import MappingProxyType
 
 from models import Card, ConjugationStat, DeckShare, PollResponse, VerbCard, db
 from config import (
@@ -45,6 +51,7 @@ from config import (
 )
 from languages import (
     AVAILABLE_LANGUAGES,
+    READY_LANGUAGES,
     get_feedback_expression,
     get_language_numbers,
     get_language_ui_description,
@@ -53,7 +60,6 @@ from languages import (
     get_languages_with_conjugation,
     get_languages_with_conjugation_materials,
     get_languages_with_learn_materials,
-    is_language_ready,
 )
 from translations import TRANSLATIONS
 from conjugation_config import (
@@ -85,6 +91,14 @@ def _conj_pool(lang_code: str):
     return CONJ_POOLS[lang_code]
 
 
+# Load every ready language's NUMBERS at import (a few ms each) so the first
+# quiz request per language doesn't pay for the module import, and so gunicorn's
+# preload_app shares the dictionaries with all workers. get_language_numbers()
+# memoises them, so the quiz views just hit its cache.
+for _lang_code in READY_LANGUAGES:
+    get_language_numbers(_lang_code)
+
+
 def _current_conjugation_lang() -> str:
     """Conjugation language for globally-rendered links (nav, home page).
 
@@ -101,6 +115,32 @@ def _current_conjugation_lang() -> str:
 load_dotenv()
 
 app = Flask(__name__)
+# trim_blocks/lstrip_blocks drop the lines that only hold a {% ... %} tag at
+# compile time, cutting ~2% of every page's bytes for free; the only joins this
+# creates are between tags in <head>.
+TEMPLATE_COMPILE_OPTIONS = {"trim_blocks": True, "lstrip_blocks": True}
+# Compiled template bytecode is shared on disk, so a recycled or freshly forked
+# gunicorn worker loads it instead of re-parsing and re-compiling every
+# template. Jinja keys entries on template name and source checksum only, so
+# the directory is namespaced by the compile options and Jinja version:
+# changing either starts a fresh cache instead of loading stale code.
+_bytecode_cache_dir = os.path.join(
+    app.instance_path,
+    "jinja-bytecode",
+    hashlib.sha256(
+        repr((jinja2.__version__, sorted(TEMPLATE_COMPILE_OPTIONS.items()))).encode()
+    ).hexdigest()[:12],
+)
+os.makedirs(_bytecode_cache_dir, exist_ok=True)
+# The template set is fixed (~130 files incl. every learn-page variant), so keep
+# every compiled template resident rather than in Jinja's bounded LRU. Auto-
+# reload stays tied to debug mode, so production never re-stats templates.
+app.jinja_options = {
+    **app.jinja_options,
+    **TEMPLATE_COMPILE_OPTIONS,
+    "cache_size": -1,
+    "bytecode_cache": jinja2.FileSystemBytecodeCache(_bytecode_cache_dir),
+}
 # Trust X-Forwarded-Proto/Host from the reverse proxy (Coolify/Traefik) so
 # url_for(..., _external=True) emits https URLs — required for the Auth0
 # redirect_uri to match the allowed callback in production.
@@ -108,6 +148,10 @@ app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 app.secret_key = os.environ.get(
     "FLASK_SECRET_KEY", "dev-secret-key-change-in-production"
 )
+# JSON responses (live validation on every keystroke, cards/conjugation APIs)
+# and the session cookie are consumed by our own JS and by Flask, neither of
+# which cares about key order, so skip sorting every dict on the way out.
+app.json.sort_keys = False
 
 # SQLite lives under Flask's instance folder (gitignored, mount as a Docker
 # volume in prod). The DATABASE_URL env var lets prod swap to Postgres later.
@@ -166,6 +210,13 @@ if _auth0_domain:
     )
 
 
+# The Auth0 userinfo claims the app reads: `sub` for ownership, the rest for the
+# display name (header, shared-deck owner). The remaining ID-token claims
+# (picture URL, timestamps, nonce, issuer/audience) would only bloat the signed
+# session cookie that travels with every request.
+SESSION_USER_CLAIMS = ("sub", "name", "nickname", "email")
+
+
 def login_required(view):
     """Redirect to /login when no Auth0 user is on the session."""
 
@@ -183,6 +234,13 @@ def initialize_ui_language():
     """Set default UI language on first visit if not already in session."""
     if "language" not in session:
         session["language"] = DEFAULT_UI_LANGUAGE
+    # `g` outlives the request when an app context is already pushed (tests,
+    # CLI), so drop what a previous request left there: the text tables
+    # _request_ui_texts() and _request_page_texts() cached and the render-cache
+    # flag gzip_response reads.
+    g.pop("ui_texts", None)
+    g.pop("page_texts", None)
+    g.pop("render_cached", None)
 
 
 @app.url_defaults
@@ -236,6 +294,84 @@ def set_cache_headers(response):
     return response
 
 
+# Pages whose body only changes with the UI language or a deploy. A content-hash
+# ETag lets a revalidating browser get an empty 304 instead of the full page.
+ETAG_ENDPOINTS = frozenset(
+    {"index", "imprint", "privacy", "about", "learn", "learn_conjugations"}
+)
+
+
+@app.after_request
+def add_page_etag(response):
+    """Tag cacheable pages and answer matching If-None-Match with 304."""
+    if (
+        request.endpoint in ETAG_ENDPOINTS
+        and request.method == "GET"
+        and response.status_code == 200
+        and not response.direct_passthrough
+    ):
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+
+# Text responses worth compressing; static files (direct_passthrough) are left
+# to the reverse proxy.
+GZIP_MIMETYPES = frozenset(
+    {
+        "text/html",
+        "text/css",
+        "text/plain",
+        "text/xml",
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    }
+)
+GZIP_MIN_SIZE = 500
+
+
+def _gzip(body: bytes) -> bytes:
+    # mtime=0 keeps the output (and so the page ETag) stable across requests.
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+# Only for bodies from the render caches (flagged with g.render_cached): those
+# repeat byte-for-byte and hold nothing user-specific, unlike quiz pages, JSON
+# or logged-in views, which are compressed without caching.
+_gzipped_shared = lru_cache(maxsize=128)(_gzip)
+
+
+# Registered after add_page_etag so it runs first: the ETag then covers the
+# encoded body and differs between the gzip and identity representations.
+@app.after_request
+def gzip_response(response):
+    """Gzip text bodies for clients that accept it.
+
+    Pages are mostly repeated markup and legal text, so they shrink several
+    times over. Bodies served from the render caches repeat byte-for-byte, so
+    their compressed form is cached as well; nothing else is.
+    """
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in GZIP_MIMETYPES
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if not request.accept_encodings["gzip"]:
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(_gzipped_shared(body) if g.get("render_cached") else _gzip(body))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
 OG_LOCALE_MAP = {
     "en": "en_US",
     "de": "de_DE",
@@ -288,37 +424,107 @@ def inject_seo_context():
     }
 
 
+# One text table per UI language with the English fallback folded in at import
+# time, so a lookup is a single dict probe: keys not translated in a UI language
+# (e.g. newer features) resolve to English rather than leaking the raw key.
+# The lang_<code>_name / lang_<code>_description keys, whose text lives in
+# languages/config.py, are folded in as well. The tables are shared by every
+# request in the worker, so they are exposed read-only.
+def _ui_text_table(ui_language: str) -> Mapping[str, str]:
+    texts = {**TRANSLATIONS[DEFAULT_UI_LANGUAGE], **TRANSLATIONS[ui_language]}
+    for lang_code in AVAILABLE_LANGUAGES:
+        texts[f"lang_{lang_code}_name"] = get_language_ui_name(lang_code, ui_language)
+        texts[f"lang_{lang_code}_description"] = get_language_ui_description(
+            lang_code, ui_language
+        )
+    return MappingProxyType(texts)
+
+
+UI_TEXTS = {ui_language: _ui_text_table(ui_language) for ui_language in TRANSLATIONS}
+
+
+def _request_ui_texts() -> tuple[str, Mapping[str, str]]:
+    """The UI language and its text table, resolved once per request.
+
+    Templates call get_text() dozens of times per render; caching the pair on
+    `g` saves re-reading the session and re-probing UI_TEXTS on each call.
+    """
+    cached = g.get("ui_texts")
+    if cached is None:
+        ui_language = session.get("language", DEFAULT_UI_LANGUAGE)
+        texts = UI_TEXTS.get(ui_language, UI_TEXTS[DEFAULT_UI_LANGUAGE])
+        cached = g.ui_texts = (ui_language, texts)
+    return cached
+
+
+# Keys whose text names the practiced language (LANGUAGE_NAME_PLACEHOLDER) in
+# at least one UI language. There are only a handful; their resolved text is
+# built once per (UI language, learn language) so get_text never scans or
+# copies a string per call.
+LEARN_LANGUAGE_KEYS = frozenset(
+    key
+    for texts in UI_TEXTS.values()
+    for key, text in texts.items()
+    if "LANGUAGE_NAME_PLACEHOLDER" in text
+)
+
+
+@lru_cache(maxsize=256)
+def _learn_language_texts(ui_language: str, learn_language: str) -> Mapping[str, str]:
+    """LEARN_LANGUAGE_KEYS texts of a UI language with the language name filled in."""
+    texts = UI_TEXTS.get(ui_language, UI_TEXTS[DEFAULT_UI_LANGUAGE])
+    name = get_language_ui_name(learn_language, ui_language)
+    return MappingProxyType(
+        {
+            key: texts.get(key, key).replace("LANGUAGE_NAME_PLACEHOLDER", name)
+            for key in LEARN_LANGUAGE_KEYS
+        }
+    )
+
+
+@lru_cache(maxsize=256)
+def _page_texts(ui_language: str, learn_language: str) -> Mapping[str, str]:
+    """A UI text table with the learn-language names filled in, read-only."""
+    texts = UI_TEXTS.get(ui_language, UI_TEXTS[DEFAULT_UI_LANGUAGE])
+    return MappingProxyType(
+        {**texts, **_learn_language_texts(ui_language, learn_language)}
+    )
+
+
+def _request_page_texts() -> Mapping[str, str]:
+    """This request's _page_texts() table for the session's learn language.
+
+    Cached on `g` with the learn language it was built for: views may change
+    the learn language mid-request (e.g. mode_selection) before rendering.
+    """
+    learn_language = session.get("learn_language", "es")
+    cached = g.get("page_texts")
+    if cached is None or cached[0] != learn_language:
+        ui_language, _ = _request_ui_texts()
+        cached = g.page_texts = (
+            learn_language,
+            _page_texts(ui_language, learn_language),
+        )
+    return cached[1]
+
+
+@app.template_global()
 def get_text(key, learn_language=None):
     """Get translated text for the current language.
 
+    Registered as a Jinja global, so every template (and every include) can
+    call it without views passing it in.
+
     `learn_language` overrides the session's learn language for keys whose
     text names the practiced language (LANGUAGE_NAME_PLACEHOLDER) — used by
     pages with their own language in the URL, e.g. /<lang>/conjugate.
     """
-    ui_language = session.get("language", DEFAULT_UI_LANGUAGE)
     if learn_language is None:
-        learn_language = session.get("learn_language", "es")
-
-    # Language name/description keys are resolved from languages/config.py
-    if key.startswith("lang_") and key.endswith("_name"):
-        lang_code = key[5:-5]
-        return get_language_ui_name(lang_code, ui_language)
-    if key.startswith("lang_") and key.endswith("_description"):
-        lang_code = key[5:-12]
-        return get_language_ui_description(lang_code, ui_language)
-
-    lang_texts = TRANSLATIONS.get(ui_language, {})
-    if key in lang_texts:
-        text = lang_texts[key]
+        texts = _request_page_texts()
     else:
-        # Fall back to English for keys not translated in this UI language
-        # (e.g. newer features) rather than leaking the raw key to the page.
-        text = TRANSLATIONS.get(DEFAULT_UI_LANGUAGE, {}).get(key, key)
-    text = text.replace(
-        "LANGUAGE_NAME_PLACEHOLDER",
-        get_language_ui_name(learn_language, ui_language),
-    )
-    return text
+        ui_language, _ = _request_ui_texts()
+        texts = _page_texts(ui_language, learn_language)
+    return texts.get(key, key)
 
 
 def _conj_text(key: str, lang_code: str) -> str:
@@ -331,31 +537,153 @@ def _conj_text(key: str, lang_code: str) -> str:
     return get_text(f"{key}_{lang_code}")
 
 
-@app.route("/")
-def index():
-    """Language selection landing page."""
-    # Create translated copy of language metadata
-    translated_languages = {}
-    for lang_code, lang_info in AVAILABLE_LANGUAGES.items():
-        translated_languages[lang_code] = {
-            **lang_info,  # Copy all properties
-            "name": get_text(f"lang_{lang_code}_name"),
-            "description": get_text(f"lang_{lang_code}_description"),
+def _split_at_slot(text: str) -> tuple[str, str] | None:
+    """`text` split around its one "{}" slot; None if it has any other braces
+    ("{0}", escaped "{{"), which only str.format renders correctly."""
+    prefix, slot, suffix = text.partition("{}")
+    if not slot or "{" in prefix + suffix or "}" in prefix + suffix:
+        return None
+    return prefix, suffix
+
+
+# "Incorrect. The answer was: {}" split around its slot once per UI language,
+# so the per-answer flash is a plain concatenation.
+FLASH_INCORRECT_PARTS = {
+    ui_language: _split_at_slot(texts["flash_incorrect"])
+    for ui_language, texts in UI_TEXTS.items()
+}
+
+
+@cache
+def _flash_correct_text(ui_language: str, lang_code: str) -> str:
+    """The correct-answer flash ("¡Correcto! 🎉"), fixed per UI/learn language."""
+    texts = UI_TEXTS.get(ui_language, UI_TEXTS[DEFAULT_UI_LANGUAGE])
+    return texts["flash_correct"].format(get_feedback_expression(lang_code))
+
+
+def _flash_answer(lang_code: str, is_correct: bool, correct_answer: str) -> None:
+    """Flash the feedback for a submitted number-quiz answer."""
+    ui_language, _ = _request_ui_texts()
+    if is_correct:
+        flash(_flash_correct_text(ui_language, lang_code), "success")
+    else:
+        if ui_language not in UI_TEXTS:
+            ui_language = DEFAULT_UI_LANGUAGE
+        parts = FLASH_INCORRECT_PARTS[ui_language]
+        if parts is None:
+            message = UI_TEXTS[ui_language]["flash_incorrect"].format(correct_answer)
+        else:
+            message = parts[0] + correct_answer + parts[1]
+        flash(message, "error")
+
+
+def _serves_cached_pages() -> bool:
+    """Whether this request may get a page from the in-process render caches.
+
+    Logged-in users, pending flash messages and debug mode (static ?v= stamps
+    change on edit) always render fresh.
+    """
+    return not (app.debug or "user" in session or session.get("_flashes"))
+
+
+# Pages served through _render_cached: privacy, imprint and about, each learn
+# page, and a results page per learning language (other scores and modes share
+# what is left). Each comes in every UI language, with or without a learning
+# language in the session.
+_RENDER_CACHE_SIZE = (
+    (
+        3
+        + len(get_languages_with_learn_materials())
+        + len(get_languages_with_conjugation_materials())
+        + len(READY_LANGUAGES)
+    )
+    * len(SUPPORTED_UI_LANGUAGES)
+    * (len(READY_LANGUAGES) + 1)
+)
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _render_cached(template, path, ui_language, learn_language, ctx):
+    return render_template(template, **dict(ctx))
+
+
+def _render_cacheable(template, **ctx):
+    """render_template() for pages that only vary by language and URL.
+
+    Logged-out visitors get the rendered string from a bounded in-process
+    cache keyed on everything the base layout reads (path for
+    canonical/breadcrumbs, UI and learn language). Absolute URLs are built
+    from SITE_URL, never from the client-supplied Host header, so the key
+    leaves the host out. See _serves_cached_pages() for who bypasses it.
+    `ctx` values must be hashable.
+
+    Templates served this way must not read `session` or `request` themselves
+    (only base.html may, within the key above): pass such values in `ctx` so
+    they become part of the key. tests/test_app.py checks this.
+    """
+    if not _serves_cached_pages():
+        return render_template(template, **ctx)
+    g.render_cached = True
+    return _render_cached(
+        template,
+        request.path,
+        session.get("language", DEFAULT_UI_LANGUAGE),
+        session.get("learn_language"),
+        tuple(sorted(ctx.items())),
+    )
+
+
+@lru_cache(maxsize=len(SUPPORTED_UI_LANGUAGES))
+def _translated_languages(ui_language: str) -> Mapping[str, dict]:
+    """AVAILABLE_LANGUAGES with name and description in the given UI language.
+
+    Depends only on the UI language, so the landing page builds it once per
+    language rather than on every hit.
+    """
+    return MappingProxyType(
+        {
+            lang_code: {
+                **lang_info,  # Copy all properties
+                "name": get_language_ui_name(lang_code, ui_language),
+                "description": get_language_ui_description(lang_code, ui_language),
+            }
+            for lang_code, lang_info in AVAILABLE_LANGUAGES.items()
         }
+    )
+
 
+def _render_index(ui_language: str) -> str:
     return render_template(
         "language_selection.html",
-        languages=translated_languages,
+        languages=_translated_languages(ui_language),
         conjugation_langs=get_languages_with_conjugation(),
-        get_text=get_text,
     )
 
 
+# The landing page's context derives from the UI language alone, so it gets its
+# own cache on the same request key as _render_cached (whose ctx must be
+# hashable). learn_language is only part of the key because the base layout
+# reads it; like _render_cached, the key leaves out the client-supplied host.
+@lru_cache(maxsize=len(SUPPORTED_UI_LANGUAGES) * (len(READY_LANGUAGES) + 1))
+def _render_index_cached(ui_language, learn_language):
+    return _render_index(ui_language)
+
+
+@app.route("/")
+def index():
+    """Language selection landing page."""
+    ui_language, _ = _request_ui_texts()
+    if not _serves_cached_pages():
+        return _render_index(ui_language)
+    g.render_cached = True
+    return _render_index_cached(ui_language, session.get("learn_language"))
+
+
 @app.route("/<lang_code>")
 def mode_selection(lang_code):
     """Mode selection page for a specific learning language."""
     # Validate language code
-    if not is_language_ready(lang_code):
+    if lang_code not in READY_LANGUAGES:
         flash(get_text("flash_invalid_language"), "error")
         return redirect(url_for("index"))
 
@@ -380,7 +708,6 @@ def mode_selection(lang_code):
         total_numbers=total_numbers,
         questions_per_quiz=QUESTIONS_PER_QUIZ,
         lang_code=lang_code,
-        get_text=get_text,
         has_learn_materials=has_learn_materials,
         has_audio_mode=has_audio_mode,
         has_conjugation=has_conjugation,
@@ -396,7 +723,7 @@ def number_modes(lang_code):
     Split out of the language menu so it has its own URL and browser Back
     returns to the language menu rather than the landing page.
     """
-    if not is_language_ready(lang_code):
+    if lang_code not in READY_LANGUAGES:
         flash(get_text("flash_invalid_language"), "error")
         return redirect(url_for("index"))
 
@@ -416,7 +743,6 @@ def number_modes(lang_code):
         total_numbers=total_numbers,
         questions_per_quiz=QUESTIONS_PER_QUIZ,
         lang_code=lang_code,
-        get_text=get_text,
         has_learn_materials=has_learn_materials,
         magnitude_level=session.get("magnitude_level", 1),
     )
@@ -425,25 +751,47 @@ def number_modes(lang_code):
 @app.route("/set_language/<lang>")
 def set_language(lang):
     """Set the UI language preference (not learning language)."""
-    if lang in SUPPORTED_UI_LANGUAGES:
+    # Only write when it changes: any assignment marks the session modified,
+    # which re-signs the cookie and sends a Set-Cookie for a no-op toggle.
+    if lang in SUPPORTED_UI_LANGUAGES and session.get("language") != lang:
         session["language"] = lang
     # Redirect back to the referring page or index
     return redirect(request.referrer or url_for("index"))
 
 
-def _results_redirect(lang_code):
-    """Redirect to results, marking session for splash overlays if earned."""
+def _reset_session(**state):
+    """Replace the session with `state`, keeping the UI language and any
+    logged-in user."""
+    preserved = {"language": session.get("language", DEFAULT_UI_LANGUAGE)}
+    if "user" in session:
+        preserved["user"] = session["user"]
+    session.clear()
+    session.update(preserved, **state)
+
+
+# Speed-bonus time limit (seconds) per quiz mode; the listening quiz ("audio")
+# shares the advanced limit.
+SPEED_BONUS_LIMITS = {
+    "easy": SPEED_BONUS_TIME_EASY,
+    "advanced": SPEED_BONUS_TIME_ADVANCED,
+    "hardcore": SPEED_BONUS_TIME_HARDCORE,
+    "audio": SPEED_BONUS_TIME_ADVANCED,
+}
+
+
+def _earned_speed_bonus(percentage):
+    """Whether the session's quiz scored over 80% within its mode's time limit."""
     quiz_start_time = session.get("quiz_start_time")
-    elapsed = time.time() - quiz_start_time if quiz_start_time else None
-    mode = session.get("mode", "easy")
-    speed_limits = {
-        "easy": SPEED_BONUS_TIME_EASY,
-        "advanced": SPEED_BONUS_TIME_ADVANCED,
-        "hardcore": SPEED_BONUS_TIME_HARDCORE,
-        "audio": SPEED_BONUS_TIME_ADVANCED,
-    }
-    speed_limit = speed_limits.get(mode, SPEED_BONUS_TIME_EASY)
+    if not quiz_start_time:
+        return False
+    speed_limit = SPEED_BONUS_LIMITS.get(
+        session.get("mode", "easy"), SPEED_BONUS_TIME_EASY
+    )
+    return time.time() - quiz_start_time < speed_limit and percentage > 80
+
 
+def _results_redirect(lang_code):
+    """Redirect to results, marking session for splash overlays if earned."""
     score = session.get("score", 0)
     score_percentage = (
         (score / QUESTIONS_PER_QUIZ) * 100 if QUESTIONS_PER_QUIZ > 0 else 0
@@ -451,17 +799,47 @@ def _results_redirect(lang_code):
 
     if score_percentage == 100:
         session["show_perfect_splash"] = True
-    if elapsed is not None and elapsed < speed_limit and score_percentage > 80:
+    if _earned_speed_bonus(score_percentage):
         session["show_speed_splash"] = True
 
+    # The deck is only needed while questions are being drawn; drop it so the
+    # finished quiz stops carrying it in the session cookie.
+    session.pop("question_deck", None)
+    session.pop("deck_position", None)
+
     return redirect(url_for("results", lang_code=lang_code))
 
 
+# Number-quiz modes: the view endpoint, the page template, the checker for a
+# submitted answer, and whether the question is multiple choice (easy) or typed
+# with the two-step reveal (advanced, hardcore).
+QUIZ_MODES = {
+    "easy": {
+        "endpoint": "quiz_easy",
+        "template": "quiz_easy.html",
+        "checker": quiz_logic.check_answer,
+        "multiple_choice": True,
+    },
+    "advanced": {
+        "endpoint": "quiz_advanced",
+        "template": "quiz_advanced.html",
+        "checker": quiz_logic.check_answer_advanced,
+        "multiple_choice": False,
+    },
+    "hardcore": {
+        "endpoint": "quiz_hardcore",
+        "template": "quiz_hardcore.html",
+        "checker": quiz_logic.check_answer_advanced,
+        "multiple_choice": False,
+    },
+}
+
+
 @app.route("/<lang_code>/start", methods=["POST"])
 def start_quiz(lang_code):
     """Initialize a new quiz session."""
     # Validate language code
-    if not is_language_ready(lang_code):
+    if lang_code not in READY_LANGUAGES:
         flash(get_text("flash_invalid_language"), "error")
         return redirect(url_for("index"))
 
@@ -469,7 +847,7 @@ def start_quiz(lang_code):
     mode = request.form.get("mode", "easy")
 
     # Validate mode
-    if mode not in ["easy", "advanced", "hardcore"]:
+    if mode not in QUIZ_MODES:
         flash(get_text("flash_invalid_mode"), "error")
         return redirect(url_for("mode_selection", lang_code=lang_code))
 
@@ -482,146 +860,114 @@ def start_quiz(lang_code):
         magnitude_level = 1
 
     # Clear quiz-related session data but keep UI language and any logged-in user
-    ui_language = session.get("language", DEFAULT_UI_LANGUAGE)
-    saved_user = session.get("user")
-    session.clear()
-    session["language"] = ui_language
-    if saved_user is not None:
-        session["user"] = saved_user
-    session["learn_language"] = lang_code
-    session["score"] = 0
-    session["total_questions"] = 0
-    session["asked_numbers"] = []
-    session["mode"] = mode
-    session["magnitude_level"] = magnitude_level
-    session["quiz_start_time"] = time.time()
+    _reset_session(
+        learn_language=lang_code,
+        score=0,
+        total_questions=0,
+        mode=mode,
+        magnitude_level=magnitude_level,
+        quiz_start_time=int(time.time()),
+    )
 
     # Redirect to appropriate quiz
-    if mode == "easy":
-        return redirect(url_for("quiz_easy", lang_code=lang_code))
-    elif mode == "advanced":
-        return redirect(url_for("quiz_advanced", lang_code=lang_code))
-    elif mode == "hardcore":
-        return redirect(url_for("quiz_hardcore", lang_code=lang_code))
-
-
-@app.route("/<lang_code>/quiz/easy", methods=["GET", "POST"])
-def quiz_easy(lang_code):
-    """Easy mode quiz page - multiple choice with 4 options."""
-
-    # Validate language and session
-    if not is_language_ready(lang_code) or session.get("learn_language") != lang_code:
-        return redirect(url_for("index"))
-
-    # Ensure user is in easy mode
-    if session.get("mode") != "easy":
-        return redirect(url_for("mode_selection", lang_code=lang_code))
-
-    # Load numbers for this language
-    try:
-        numbers = get_language_numbers(lang_code)
-    except ValueError:
-        flash(get_text("flash_language_load_error"), "error")
-        return redirect(url_for("mode_selection", lang_code=lang_code))
-
-    if request.method == "POST":
-        # Process the submitted answer
-        user_answer = request.form.get("answer")
-        correct_answer = session.get("correct_answer")
-        if user_answer and correct_answer:
-            is_correct = quiz_logic.check_answer(user_answer, correct_answer)
+    return redirect(url_for(QUIZ_MODES[mode]["endpoint"], lang_code=lang_code))
 
-            if is_correct:
-                session["score"] = session.get("score", 0) + 1
-                flash(
-                    get_text("flash_correct").format(
-                        get_feedback_expression(lang_code)
-                    ),
-                    "success",
-                )
-            else:
-                flash(get_text("flash_incorrect").format(correct_answer), "error")
 
-            session["total_questions"] = session.get("total_questions", 0) + 1
+def _quiz_round_over():
+    """Whether the number quiz has its answers in and no question left mounted.
 
-        # Clear current question so next GET generates a new one
-        session.pop("current_number", None)
-        session.pop("correct_answer", None)
-        session.pop("current_options", None)  # Clear options too
+    After a reveal the current question stays in the session (with the total
+    already incremented) so it must still render; the "next" POST is what
+    clears it and ends the round.
+    """
+    return (
+        "current_number" not in session
+        and session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ
+    )
 
-        # Check if quiz is complete
-        if session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ:
-            return _results_redirect(lang_code)
 
-        # Continue to next question
-        return redirect(url_for("quiz_easy", lang_code=lang_code))
+def _mounted_or_new_question(numbers, multiple_choice=False):
+    """The question mounted on the session, or a newly drawn one stored there.
 
-    # GET request - display question
-    # Check if quiz should end
-    # End the quiz only once no question is still mounted. After a reveal the
-    # current question stays in the session (with total already incremented) so
-    # it must still render; the "next" POST is what clears it and ends the round.
-    if (
-        "current_number" not in session
-        and session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ
-    ):
-        return redirect(url_for("results", lang_code=lang_code))
+    A page refresh keeps the mounted question; otherwise the next number comes
+    off the round's question deck (drawn from `numbers` when empty) and, for
+    multiple choice, four options are generated with it. Only the options'
+    seed goes into the session cookie; a refresh regenerates the same options
+    from it.
 
-    # Check if we already have a current question (page refresh)
+    Returns:
+        Tuple of (number, correct_answer, options); options is None unless
+        `multiple_choice`.
+    """
     if (
         "current_number" in session
         and "correct_answer" in session
-        and "current_options" in session
+        and (
+            not multiple_choice
+            or "options_seed" in session
+            or "current_options" in session
+        )
     ):
-        number = session["current_number"]
-        correct_answer = session["correct_answer"]
-        options = session["current_options"]
-    else:
-        # Generate new question
-        asked_numbers = session.get("asked_numbers", [])
-        number, correct_answer = quiz_logic.get_random_question(
-            numbers, asked_numbers, magnitude_level=session.get("magnitude_level", 1)
+        number, correct_answer = session["current_number"], session["correct_answer"]
+        if not multiple_choice:
+            options = None
+        elif "options_seed" in session:
+            options = quiz_logic.generate_multiple_choice(
+                numbers, number, correct_answer, seed=session["options_seed"]
+            )
+        else:  # sessions from before the seed still carry the option list
+            options = session["current_options"]
+        return number, correct_answer, options
+
+    # The round's numbers are drawn together as one deck, so each question is
+    # a step along it rather than a weighted pass over every number. Entries
+    # outside `numbers` (the listening quiz's playable subset) are skipped.
+    deck = session.get("question_deck", [])
+    position = session.get("deck_position", 0)
+    while position < len(deck) and deck[position] not in numbers:
+        position += 1
+    if position == len(deck):
+        # Skipped (empty) answers draw without ending the round, so a deck can
+        # run out. The next one leaves out the numbers this one asked, so none
+        # repeats within the round (unless that would leave nothing to draw).
+        deck = quiz_logic.draw_question_deck(
+            numbers,
+            QUESTIONS_PER_QUIZ,
+            session.get("magnitude_level", 1),
+            exclude_numbers=deck,
         )
-
-        # Generate multiple choice options
-        options = quiz_logic.generate_multiple_choice(numbers, number, correct_answer)
-
-        # Store in session
-        session["current_number"] = number
-        session["correct_answer"] = correct_answer
-        session["current_options"] = options
-
-        # Update asked numbers
-        if "asked_numbers" not in session:
-            session["asked_numbers"] = []
-        session["asked_numbers"].append(number)
-
-    # Get current progress
-    score = session.get("score", 0)
-    total = session.get("total_questions", 0)
-
-    return render_template(
-        "quiz_easy.html",
-        number=number,
-        options=options,
-        score=score,
-        total=total,
-        max_questions=QUESTIONS_PER_QUIZ,
-        lang_code=lang_code,
-        get_text=get_text,
-    )
+        position = 0
+    number = deck[position]
+    correct_answer = numbers[number]
+    question_state = {
+        "current_number": number,
+        "correct_answer": correct_answer,
+        "question_deck": deck,
+        "deck_position": position + 1,
+    }
+    options = None
+    if multiple_choice:
+        seed = secrets.randbits(32)
+        options = quiz_logic.generate_multiple_choice(
+            numbers, number, correct_answer, seed=seed
+        )
+        question_state["options_seed"] = seed
+    session.update(question_state)
+    return number, correct_answer, options
 
 
-@app.route("/<lang_code>/quiz/advanced", methods=["GET", "POST"])
-def quiz_advanced(lang_code):
-    """Advanced mode quiz page - text input with live validation."""
+def _number_quiz(lang_code, mode):
+    """Shared GET/POST handler behind the easy, advanced and hardcore quizzes."""
+    config = QUIZ_MODES[mode]
+    endpoint = config["endpoint"]
+    multiple_choice = config["multiple_choice"]
 
     # Validate language and session
-    if not is_language_ready(lang_code) or session.get("learn_language") != lang_code:
+    if lang_code not in READY_LANGUAGES or session.get("learn_language") != lang_code:
         return redirect(url_for("index"))
 
-    # Ensure user is in advanced mode
-    if session.get("mode") != "advanced":
+    # Ensure user is in this mode
+    if session.get("mode") != mode:
         return redirect(url_for("mode_selection", lang_code=lang_code))
 
     # Load numbers for this language
@@ -632,118 +978,124 @@ def quiz_advanced(lang_code):
         return redirect(url_for("mode_selection", lang_code=lang_code))
 
     if request.method == "POST":
-        # Two-step reveal: mark the question as revealed and re-render the same
-        # question so the modal can show the answer. Counts as a wrong attempt.
-        if "reveal" in request.form:
-            session["total_questions"] = session.get("total_questions", 0) + 1
-            session["current_revealed"] = True
-            return redirect(url_for("quiz_advanced", lang_code=lang_code))
-
-        # Advance from a revealed question. The wrong attempt was already
-        # recorded; the user must retype the shown answer before advancing (the
-        # client enforces this too, but never trust the client). A wrong or
-        # empty answer keeps the question mounted and revealed.
-        if "next" in request.form:
-            user_answer = request.form.get("answer", "").strip()
-            correct_answer = session.get("correct_answer")
-            if not (
-                user_answer
-                and correct_answer
-                and quiz_logic.check_answer_advanced(user_answer, correct_answer)
-            ):
-                return redirect(url_for("quiz_advanced", lang_code=lang_code))
-            session["current_revealed"] = False
-            session.pop("current_number", None)
-            session.pop("correct_answer", None)
-            if session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ:
-                return _results_redirect(lang_code)
-            return redirect(url_for("quiz_advanced", lang_code=lang_code))
+        # A resubmission after the round ended (e.g. browser back) has nothing
+        # left to check.
+        if _quiz_round_over():
+            return redirect(url_for("results", lang_code=lang_code))
+
+        form = request.form
+        if not multiple_choice:
+            # Two-step reveal: mark the question as revealed and re-render the
+            # same question so the modal can show the answer. Counts as a wrong
+            # attempt.
+            if "reveal" in form:
+                session["total_questions"] = session.get("total_questions", 0) + 1
+                session["current_revealed"] = True
+                return redirect(url_for(endpoint, lang_code=lang_code))
+
+            # Advance from a revealed question. The wrong attempt was already
+            # recorded; the user must retype the shown answer before advancing
+            # (the client enforces this too, but never trust the client). A
+            # wrong or empty answer keeps the question mounted and revealed.
+            if "next" in form:
+                user_answer = form.get("answer", "").strip()
+                correct_answer = session.get("correct_answer")
+                if not (
+                    user_answer
+                    and correct_answer
+                    and config["checker"](user_answer, correct_answer)
+                ):
+                    return redirect(url_for(endpoint, lang_code=lang_code))
+                session["current_revealed"] = False
+                session.pop("current_number", None)
+                session.pop("correct_answer", None)
+                if session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ:
+                    return _results_redirect(lang_code)
+                return redirect(url_for(endpoint, lang_code=lang_code))
 
         # Process the submitted answer
-        user_answer = request.form.get("answer", "").strip()
+        user_answer = form.get("answer", "")
+        if not multiple_choice:
+            user_answer = user_answer.strip()
         correct_answer = session.get("correct_answer")
+        total = session.get("total_questions", 0)
 
         if user_answer and correct_answer:
-            # Use word-by-word validation for final check
-            is_correct = quiz_logic.check_answer_advanced(user_answer, correct_answer)
-
+            is_correct = config["checker"](user_answer, correct_answer)
             if is_correct:
                 session["score"] = session.get("score", 0) + 1
-                flash(
-                    get_text("flash_correct").format(
-                        get_feedback_expression(lang_code)
-                    ),
-                    "success",
-                )
-            else:
-                flash(get_text("flash_incorrect").format(correct_answer), "error")
+            _flash_answer(lang_code, is_correct, correct_answer)
 
-            session["total_questions"] = session.get("total_questions", 0) + 1
+            total += 1
+            session["total_questions"] = total
 
         # Clear current question so next GET generates a new one
         session.pop("current_number", None)
         session.pop("correct_answer", None)
-        session["current_revealed"] = False
+        if multiple_choice:
+            session.pop("options_seed", None)
+            session.pop("current_options", None)
+        else:
+            session["current_revealed"] = False
 
         # Check if quiz is complete
-        if session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ:
+        if total >= QUESTIONS_PER_QUIZ:
             return _results_redirect(lang_code)
 
         # Continue to next question
-        return redirect(url_for("quiz_advanced", lang_code=lang_code))
+        return redirect(url_for(endpoint, lang_code=lang_code))
 
     # GET request - display question
-    # Check if quiz should end
-    # End the quiz only once no question is still mounted. After a reveal the
-    # current question stays in the session (with total already incremented) so
-    # it must still render; the "next" POST is what clears it and ends the round.
-    if (
-        "current_number" not in session
-        and session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ
-    ):
+    if _quiz_round_over():
         return redirect(url_for("results", lang_code=lang_code))
+    total = session.get("total_questions", 0)
 
-    # Check if we already have a current question (page refresh)
-    if "current_number" in session and "correct_answer" in session:
-        number = session["current_number"]
-        correct_answer = session["correct_answer"]
-    else:
-        # Generate new question
-        asked_numbers = session.get("asked_numbers", [])
-        number, correct_answer = quiz_logic.get_random_question(
-            numbers, asked_numbers, magnitude_level=session.get("magnitude_level", 1)
-        )
-
-        # Store in session
-        session["current_number"] = number
-        session["correct_answer"] = correct_answer
-
-        # Update asked numbers
-        if "asked_numbers" not in session:
-            session["asked_numbers"] = []
-        session["asked_numbers"].append(number)
+    number, correct_answer, options = _mounted_or_new_question(numbers, multiple_choice)
 
-    # Get current progress
-    score = session.get("score", 0)
-    total = session.get("total_questions", 0)
+    # Multiple choice never sends the answer to the page; typed modes need it
+    # for the reveal modal.
+    if multiple_choice:
+        question = {"options": options}
+    else:
+        question = {
+            "correct_answer": correct_answer,
+            "revealed": bool(session.get("current_revealed")),
+        }
 
     return render_template(
-        "quiz_advanced.html",
+        config["template"],
         number=number,
-        correct_answer=correct_answer,
-        revealed=bool(session.get("current_revealed")),
-        score=score,
+        **question,
+        score=session.get("score", 0),
         total=total,
         max_questions=QUESTIONS_PER_QUIZ,
         lang_code=lang_code,
-        get_text=get_text,
     )
 
 
+@app.route("/<lang_code>/quiz/easy", methods=["GET", "POST"])
+def quiz_easy(lang_code):
+    """Easy mode quiz page - multiple choice with 4 options."""
+    return _number_quiz(lang_code, "easy")
+
+
+@app.route("/<lang_code>/quiz/advanced", methods=["GET", "POST"])
+def quiz_advanced(lang_code):
+    """Advanced mode quiz page - text input with live validation."""
+    return _number_quiz(lang_code, "advanced")
+
+
+@app.route("/<lang_code>/quiz/hardcore", methods=["GET", "POST"])
+def quiz_hardcore(lang_code):
+    """Hardcore mode quiz page - text input without intermediate feedback."""
+    return _number_quiz(lang_code, "hardcore")
+
+
 @app.route("/api/validate", methods=["POST"])
 def validate_answer():
     """API endpoint for live validation of user input."""
-    user_input = request.json.get("input", "")
+    payload = request.get_json(silent=True) or {}
+    user_input = payload.get("input") or ""
     correct_answer = session.get("correct_answer", "")
     lang_code = session.get("learn_language", "")
 
@@ -760,134 +1112,6 @@ def validate_answer():
     return jsonify(validation)
 
 
-@app.route("/<lang_code>/quiz/hardcore", methods=["GET", "POST"])
-def quiz_hardcore(lang_code):
-    """Hardcore mode quiz page - text input without intermediate feedback."""
-
-    # Validate language and session
-    if not is_language_ready(lang_code) or session.get("learn_language") != lang_code:
-        return redirect(url_for("index"))
-
-    # Ensure user is in hardcore mode
-    if session.get("mode") != "hardcore":
-        return redirect(url_for("mode_selection", lang_code=lang_code))
-
-    # Load numbers for this language
-    try:
-        numbers = get_language_numbers(lang_code)
-    except ValueError:
-        flash(get_text("flash_language_load_error"), "error")
-        return redirect(url_for("mode_selection", lang_code=lang_code))
-
-    if request.method == "POST":
-        # Two-step reveal: mark the question as revealed and re-render the same
-        # question so the modal can show the answer. Counts as a wrong attempt.
-        if "reveal" in request.form:
-            session["total_questions"] = session.get("total_questions", 0) + 1
-            session["current_revealed"] = True
-            return redirect(url_for("quiz_hardcore", lang_code=lang_code))
-
-        # Advance from a revealed question. The wrong attempt was already
-        # recorded; the user must retype the shown answer before advancing (the
-        # client enforces this too, but never trust the client). A wrong or
-        # empty answer keeps the question mounted and revealed.
-        if "next" in request.form:
-            user_answer = request.form.get("answer", "").strip()
-            correct_answer = session.get("correct_answer")
-            if not (
-                user_answer
-                and correct_answer
-                and quiz_logic.check_answer_advanced(user_answer, correct_answer)
-            ):
-                return redirect(url_for("quiz_hardcore", lang_code=lang_code))
-            session["current_revealed"] = False
-            session.pop("current_number", None)
-            session.pop("correct_answer", None)
-            if session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ:
-                return _results_redirect(lang_code)
-            return redirect(url_for("quiz_hardcore", lang_code=lang_code))
-
-        # Process the submitted answer
-        user_answer = request.form.get("answer", "").strip()
-        correct_answer = session.get("correct_answer")
-
-        if user_answer and correct_answer:
-            # Use advanced validation for final check
-            is_correct = quiz_logic.check_answer_advanced(user_answer, correct_answer)
-
-            if is_correct:
-                session["score"] = session.get("score", 0) + 1
-                flash(
-                    get_text("flash_correct").format(
-                        get_feedback_expression(lang_code)
-                    ),
-                    "success",
-                )
-            else:
-                flash(get_text("flash_incorrect").format(correct_answer), "error")
-
-            session["total_questions"] = session.get("total_questions", 0) + 1
-
-        # Clear current question so next GET generates a new one
-        session.pop("current_number", None)
-        session.pop("correct_answer", None)
-        session["current_revealed"] = False
-
-        # Check if quiz is complete
-        if session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ:
-            return _results_redirect(lang_code)
-
-        # Continue to next question
-        return redirect(url_for("quiz_hardcore", lang_code=lang_code))
-
-    # GET request - display question
-    # Check if quiz should end
-    # End the quiz only once no question is still mounted. After a reveal the
-    # current question stays in the session (with total already incremented) so
-    # it must still render; the "next" POST is what clears it and ends the round.
-    if (
-        "current_number" not in session
-        and session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ
-    ):
-        return redirect(url_for("results", lang_code=lang_code))
-
-    # Check if we already have a current question (page refresh)
-    if "current_number" in session and "correct_answer" in session:
-        number = session["current_number"]
-        correct_answer = session["correct_answer"]
-    else:
-        # Generate new question
-        asked_numbers = session.get("asked_numbers", [])
-        number, correct_answer = quiz_logic.get_random_question(
-            numbers, asked_numbers, magnitude_level=session.get("magnitude_level", 1)
-        )
-
-        # Store in session
-        session["current_number"] = number
-        session["correct_answer"] = correct_answer
-
-        # Update asked numbers
-        if "asked_numbers" not in session:
-            session["asked_numbers"] = []
-        session["asked_numbers"].append(number)
-
-    # Get current progress
-    score = session.get("score", 0)
-    total = session.get("total_questions", 0)
-
-    return render_template(
-        "quiz_hardcore.html",
-        number=number,
-        correct_answer=correct_answer,
-        revealed=bool(session.get("current_revealed")),
-        score=score,
-        total=total,
-        max_questions=QUESTIONS_PER_QUIZ,
-        lang_code=lang_code,
-        get_text=get_text,
-    )
-
-
 def _available_audio_numbers(lang_code):
     """Return the set of numbers (ints) we have a pre-generated MP3 for."""
     audio_dir = Path(app.static_folder) / "audio" / lang_code
@@ -906,7 +1130,7 @@ def _available_audio_numbers(lang_code):
 def listen_start(lang_code):
     """Initialize a new Listening session."""
     if (
-        not is_language_ready(lang_code)
+        lang_code not in READY_LANGUAGES
         or lang_code not in get_languages_with_audio_mode()
     ):
         flash(get_text("flash_invalid_language"), "error")
@@ -919,19 +1143,14 @@ def listen_start(lang_code):
     if magnitude_level not in range(1, 6):
         magnitude_level = 1
 
-    ui_language = session.get("language", DEFAULT_UI_LANGUAGE)
-    saved_user = session.get("user")
-    session.clear()
-    session["language"] = ui_language
-    if saved_user is not None:
-        session["user"] = saved_user
-    session["learn_language"] = lang_code
-    session["score"] = 0
-    session["total_questions"] = 0
-    session["asked_numbers"] = []
-    session["mode"] = "audio"
-    session["magnitude_level"] = magnitude_level
-    session["quiz_start_time"] = time.time()
+    _reset_session(
+        learn_language=lang_code,
+        score=0,
+        total_questions=0,
+        mode="audio",
+        magnitude_level=magnitude_level,
+        quiz_start_time=int(time.time()),
+    )
 
     return redirect(url_for("listen_quiz", lang_code=lang_code))
 
@@ -940,7 +1159,7 @@ def listen_start(lang_code):
 def listen_quiz(lang_code):
     """Listening quiz: play a number, user types the digits."""
     if (
-        not is_language_ready(lang_code)
+        lang_code not in READY_LANGUAGES
         or lang_code not in get_languages_with_audio_mode()
     ):
         return redirect(url_for("index"))
@@ -961,12 +1180,16 @@ def listen_quiz(lang_code):
         return redirect(url_for("mode_selection", lang_code=lang_code))
 
     if request.method == "POST":
-        if "reveal" in request.form:
+        if _quiz_round_over():
+            return redirect(url_for("results", lang_code=lang_code))
+
+        form = request.form
+        if "reveal" in form:
             session["total_questions"] = session.get("total_questions", 0) + 1
             session["current_revealed"] = True
             return redirect(url_for("listen_quiz", lang_code=lang_code))
 
-        if "next" in request.form:
+        if "next" in form:
             session["current_revealed"] = False
             session.pop("current_number", None)
             session.pop("correct_answer", None)
@@ -974,20 +1197,17 @@ def listen_quiz(lang_code):
                 return _results_redirect(lang_code)
             return redirect(url_for("listen_quiz", lang_code=lang_code))
 
-        raw_answer = request.form.get("answer", "")
+        raw_answer = form.get("answer", "")
         digits = re.sub(r"\D", "", raw_answer)
         current_number = session.get("current_number")
         correct_word = session.get("correct_answer")
+        total = session.get("total_questions", 0)
 
         if digits and current_number is not None:
             if int(digits) == current_number:
                 session["score"] = session.get("score", 0) + 1
-                flash(
-                    get_text("flash_correct").format(
-                        get_feedback_expression(lang_code)
-                    ),
-                    "success",
-                )
+                ui_language, _ = _request_ui_texts()
+                flash(_flash_correct_text(ui_language, lang_code), "success")
             else:
                 flash(
                     get_text("flash_incorrect_audio").format(
@@ -995,41 +1215,23 @@ def listen_quiz(lang_code):
                     ),
                     "error",
                 )
-            session["total_questions"] = session.get("total_questions", 0) + 1
+            total += 1
+            session["total_questions"] = total
 
         session.pop("current_number", None)
         session.pop("correct_answer", None)
         session["current_revealed"] = False
 
-        if session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ:
+        if total >= QUESTIONS_PER_QUIZ:
             return _results_redirect(lang_code)
 
         return redirect(url_for("listen_quiz", lang_code=lang_code))
 
-    # End the quiz only once no question is still mounted. After a reveal the
-    # current question stays in the session (with total already incremented) so
-    # it must still render; the "next" POST is what clears it and ends the round.
-    if (
-        "current_number" not in session
-        and session.get("total_questions", 0) >= QUESTIONS_PER_QUIZ
-    ):
+    if _quiz_round_over():
         return redirect(url_for("results", lang_code=lang_code))
+    total = session.get("total_questions", 0)
 
-    if "current_number" in session and "correct_answer" in session:
-        number = session["current_number"]
-        correct_answer = session["correct_answer"]
-    else:
-        asked_numbers = session.get("asked_numbers", [])
-        number, correct_answer = quiz_logic.get_random_question(
-            playable_numbers,
-            asked_numbers,
-            magnitude_level=session.get("magnitude_level", 1),
-        )
-        session["current_number"] = number
-        session["correct_answer"] = correct_answer
-        if "asked_numbers" not in session:
-            session["asked_numbers"] = []
-        session["asked_numbers"].append(number)
+    number, correct_answer, _ = _mounted_or_new_question(playable_numbers)
 
     audio_url = url_for("static", filename=f"audio/{lang_code}/{number}.mp3")
 
@@ -1040,10 +1242,9 @@ def listen_quiz(lang_code):
         audio_url=audio_url,
         revealed=bool(session.get("current_revealed")),
         score=session.get("score", 0),
-        total=session.get("total_questions", 0),
+        total=total,
         max_questions=QUESTIONS_PER_QUIZ,
         lang_code=lang_code,
-        get_text=get_text,
     )
 
 
@@ -1051,7 +1252,7 @@ def listen_quiz(lang_code):
 def results(lang_code):
     """Display final quiz results."""
     # Validate language
-    if not is_language_ready(lang_code) or session.get("learn_language") != lang_code:
+    if lang_code not in READY_LANGUAGES or session.get("learn_language") != lang_code:
         return redirect(url_for("index"))
 
     score = session.get("score", 0)
@@ -1061,25 +1262,21 @@ def results(lang_code):
     score_ratio = (score / max_questions) if max_questions > 0 else 0
     percentage = score_ratio * 100
 
-    mode = session.get("mode", "easy")
-    speed_limits = {
-        "easy": SPEED_BONUS_TIME_EASY,
-        "advanced": SPEED_BONUS_TIME_ADVANCED,
-        "hardcore": SPEED_BONUS_TIME_HARDCORE,
-        "audio": SPEED_BONUS_TIME_ADVANCED,
-    }
-    quiz_start_time = session.get("quiz_start_time")
-    elapsed = time.time() - quiz_start_time if quiz_start_time else None
-    speed_limit = speed_limits.get(mode, SPEED_BONUS_TIME_EASY)
-    is_speed_bonus = elapsed is not None and elapsed < speed_limit and percentage > 80
+    is_speed_bonus = _earned_speed_bonus(percentage)
 
     show_splash = session.pop("show_speed_splash", False)
     show_perfect_splash = session.pop("show_perfect_splash", False)
 
     has_learn_materials = lang_code in get_languages_with_learn_materials()
 
-    return render_template(
+    # Pending flashes (the final answer's feedback) bypass the cache; a refresh
+    # or a revisit of the same result is served from it. The "Try again" form
+    # restarts the same mode, so mode and level are part of the context (and
+    # with it the cache key).
+    return _render_cacheable(
         "results.html",
+        mode=session.get("mode", "easy"),
+        magnitude_level=session.get("magnitude_level", 1),
         score=score,
         attempted=attempted,
         max_questions=max_questions,
@@ -1090,45 +1287,71 @@ def results(lang_code):
         is_speed_bonus=is_speed_bonus,
         show_splash=show_splash,
         show_perfect_splash=show_perfect_splash,
-        get_text=get_text,
     )
 
 
 @app.route("/restart", methods=["POST"])
 def restart():
     """Restart the quiz."""
-    ui_language = session.get("language", DEFAULT_UI_LANGUAGE)
-    saved_user = session.get("user")
-    session.clear()
-    session["language"] = ui_language
-    if saved_user is not None:
-        session["user"] = saved_user
+    _reset_session()
     return redirect(url_for("index"))
 
 
 @app.route("/privacy")
 def privacy():
     """Display privacy policy page."""
-    return render_template("privacy.html", get_text=get_text)
+    return _render_cacheable("privacy.html")
 
 
 @app.route("/imprint")
 def imprint():
     """Display imprint/impressum page."""
-    return render_template("imprint.html", get_text=get_text)
+    return _render_cacheable("imprint.html")
 
 
 @app.route("/about")
 def about():
     """Display about page."""
-    return render_template("about.html", get_text=get_text)
+    return _render_cacheable("about.html")
+
+
+def _index_templates(pattern: str) -> dict[tuple[str, str], str]:
+    """Template names matching `pattern`, keyed by its (lang, ui_lang) groups."""
+    return {
+        match.groups(): name
+        for name in app.jinja_env.list_templates()
+        if (match := re.fullmatch(pattern, name))
+    }
+
+
+# learn_<lang>_<ui_lang>.html and learn_conjugations_<lang>_<ui_lang>.html
+# variants by (lang, ui_lang), indexed once from the template folder so a
+# missing UI-language variant falls back to English without a failed loader
+# lookup on every request.
+LEARN_TEMPLATES = _index_templates(r"learn_([a-z]{2})_([a-z]{2})\.html")
+LEARN_CONJUGATIONS_TEMPLATES = _index_templates(
+    r"learn_conjugations_([a-z]{2})_([a-z]{2})\.html"
+)
+
+
+def prewarm_templates() -> None:
+    """Compile (or load from the bytecode cache) every template.
+
+    Called from gunicorn's on_starting hook, after preload_app has imported
+    the app in the master: the workers fork with every template resident, so
+    no first request per template and worker pays for loading it. ~60 ms with
+    a warm bytecode cache, about a second cold, so it is not done at import
+    (CLI commands such as `flask db upgrade` and the tests skip it).
+    """
+    for template_name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(template_name)
 
 
 @app.route("/<lang_code>/learn")
 def learn(lang_code):
     """Display learn/tutorial page for a specific language."""
     # Validate language
-    if not is_language_ready(lang_code):
+    if lang_code not in READY_LANGUAGES:
         return redirect(url_for("index"))
 
     if lang_code not in get_languages_with_learn_materials():
@@ -1136,20 +1359,15 @@ def learn(lang_code):
         return redirect(url_for("mode_selection", lang_code=lang_code))
 
     ui_lang = session.get("language", DEFAULT_UI_LANGUAGE)
-    template = f"learn_{lang_code}_{ui_lang}.html"
-
-    # Fallback to English if template doesn't exist
-    try:
-        return render_template(template, lang_code=lang_code, get_text=get_text)
-    except jinja2.TemplateNotFound:
-        template = f"learn_{lang_code}_en.html"
-        return render_template(template, lang_code=lang_code, get_text=get_text)
+    # Fallback to English if the UI-language variant doesn't exist
+    template = LEARN_TEMPLATES.get((lang_code, ui_lang), f"learn_{lang_code}_en.html")
+    return _render_cacheable(template, lang_code=lang_code)
 
 
 @app.route("/<lang_code>/learn/conjugations")
 def learn_conjugations(lang_code):
     """Display the verb-conjugation learn page for a language (Spanish only today)."""
-    if not is_language_ready(lang_code):
+    if lang_code not in READY_LANGUAGES:
         return redirect(url_for("index"))
 
     if lang_code not in get_languages_with_conjugation_materials():
@@ -1157,14 +1375,11 @@ def learn_conjugations(lang_code):
         return redirect(url_for("mode_selection", lang_code=lang_code))
 
     ui_lang = session.get("language", DEFAULT_UI_LANGUAGE)
-    template = f"learn_conjugations_{lang_code}_{ui_lang}.html"
-
     # Fallback to English if the UI-language variant doesn't exist.
-    try:
-        return render_template(template, lang_code=lang_code, get_text=get_text)
-    except jinja2.TemplateNotFound:
-        template = f"learn_conjugations_{lang_code}_en.html"
-        return render_template(template, lang_code=lang_code, get_text=get_text)
+    template = LEARN_CONJUGATIONS_TEMPLATES.get(
+        (lang_code, ui_lang), f"learn_conjugations_{lang_code}_en.html"
+    )
+    return _render_cacheable(template, lang_code=lang_code)
 
 
 @app.route("/login")
@@ -1188,7 +1403,10 @@ def callback():
         app.logger.warning("Auth0 callback failed: %s", exc)
         flash(get_text("flash_login_failed"), "error")
         return redirect(url_for("index"))
-    session["user"] = token["userinfo"]
+    userinfo = token["userinfo"]
+    session["user"] = {
+        claim: userinfo[claim] for claim in SESSION_USER_CLAIMS if claim in userinfo
+    }
     # If the user was sent to /login from a share URL, route them back to it.
     pending_token = session.pop("pending_import_token", None)
     if pending_token:
@@ -1223,8 +1441,6 @@ def _user_card_or_404(card_id: int) -> Card:
     """Fetch a card and 404 if it does not belong to the current user."""
     card = db.session.get(Card, card_id)
     if card is None or card.user_sub != _current_user_sub():
-        from flask import abort
-
         abort(404)
     return card
 
@@ -1266,7 +1482,7 @@ def cards():
         if candidate is not None and candidate.user_sub == _current_user_sub():
             edit_card = candidate
     practice_lang = session.get("learn_language")
-    if practice_lang and is_language_ready(practice_lang):
+    if practice_lang in READY_LANGUAGES:
         practice_numbers_url = url_for("mode_selection", lang_code=practice_lang)
     else:
         practice_numbers_url = url_for("index")
@@ -1277,11 +1493,9 @@ def cards():
     }
     return render_template(
         "cards.html",
-        user=session["user"],
         cards=user_cards,
         edit_card=edit_card,
         practice_numbers_url=practice_numbers_url,
-        get_text=get_text,
         stats=stats,
         stats_json=stats_json,
         importable_verbs=importable_verbs,
@@ -1542,7 +1756,6 @@ def cards_import(token: str):
         return render_template(
             "cards_import.html",
             share=None,
-            get_text=get_text,
         ), 404
     if "user" not in session:
         # Stash the import target on the session so post-login we can route back.
@@ -1553,7 +1766,6 @@ def cards_import(token: str):
         share=share,
         card_count=len(share.cards),
         is_own=share.owner_sub == _current_user_sub(),
-        get_text=get_text,
     )
 
 
@@ -1964,7 +2176,6 @@ def cards_practice():
     # (template renders it as the prominent study display).
     return render_template(
         "cards_practice.html",
-        user=session["user"],
         prompt_text=prompt_text,
         correct_answer=correct_answer
         if (revealed or difficulty == "hardcore")
@@ -1977,7 +2188,6 @@ def cards_practice():
         max_questions=min(count, total_cards),
         verb_infinitive=verb_infinitive,
         verb_lang=verb_lang,
-        get_text=get_text,
     )
 
 
@@ -1993,7 +2203,6 @@ def cards_practice_results():
     percentage = (score / total * 100) if total else 0
     return render_template(
         "cards_results.html",
-        user=session["user"],
         score=score,
         total=total,
         percentage=percentage,
@@ -2006,7 +2215,6 @@ def cards_practice_results():
             "count": state.get("count", 10),
             "recap": state.get("recap"),
         },
-        get_text=get_text,
     )
 
 
@@ -2028,7 +2236,8 @@ def cards_validate_api():
 
     prompt_side = state["current_prompt_side"]
 
-    user_input = (request.json or {}).get("input", "")
+    payload = request.get_json(silent=True) or {}
+    user_input = payload.get("input") or ""
     # `lang_code="es"` forces the word_based strategy regardless of the card's
     # actual language — fine for free-form vocabulary.
     acceptable = _acceptable_answers(card, prompt_side)
@@ -2052,8 +2261,6 @@ def _user_verb_or_404(verb_id: int) -> VerbCard:
     """Fetch a VerbCard and 404 if it does not belong to the current user."""
     verb = db.session.get(VerbCard, verb_id)
     if verb is None or verb.user_sub != _current_user_sub():
-        from flask import abort
-
         abort(404)
     return verb
 
@@ -2389,8 +2596,6 @@ def _build_conjugate_dashboard_stats(
 def _require_conjugation_lang(lang_code: str) -> None:
     """404 for a language that has no verb-conjugation practice section."""
     if lang_code not in get_languages_with_conjugation():
-        from flask import abort
-
         abort(404)
 
 
@@ -2418,7 +2623,6 @@ def conjugate(lang_code):
     ).replace("</", "<\\/")
     return render_template(
         "conjugate.html",
-        user=session["user"],
         lang_code=lang_code,
         verbs=verbs,
         tenses=conj_tenses(lang_code),
@@ -2428,7 +2632,6 @@ def conjugate(lang_code):
         practice_numbers_url=practice_numbers_url,
         practice_numbers_label=practice_numbers_label,
         dashboard=dashboard,
-        get_text=get_text,
         conj_text=lambda key: _conj_text(key, lang_code),
         card_import_count=card_import_count,
         missing_in_cards_count=len(missing),
@@ -2862,7 +3065,6 @@ def _conjugate_question_view(state: dict, current: dict, lang_code: str):
     )
     return render_template(
         "conjugate_practice.html",
-        user=session["user"],
         lang_code=lang_code,
         infinitive=current["infinitive"],
         pronoun=person_label(lang_code, current["person_index"]),
@@ -2875,7 +3077,6 @@ def _conjugate_question_view(state: dict, current: dict, lang_code: str):
         score=state["score"],
         total=state["total"],
         max_questions=state.get("count", CONJ_QUESTIONS_DEFAULT),
-        get_text=get_text,
     )
 
 
@@ -3046,7 +3247,6 @@ def conjugate_practice_results(lang_code):
     percentage = (score / total * 100) if total else 0
     return render_template(
         "conjugate_results.html",
-        user=session["user"],
         lang_code=lang_code,
         score=score,
         total=total,
@@ -3063,7 +3263,6 @@ def conjugate_practice_results(lang_code):
             "reveal_mode": state.get("reveal_mode", "type"),
             "count": state.get("count", CONJ_QUESTIONS_DEFAULT),
         },
-        get_text=get_text,
         conj_text=lambda key: _conj_text(key, lang_code),
     )
 
@@ -3078,7 +3277,8 @@ def conjugate_validate_api():
         return jsonify({"error": "No active conjugation question"}), 400
     if state.get("difficulty") == "hardcore":
         return jsonify({"error": "Validation disabled in hardcore mode"}), 400
-    user_input = (request.json or {}).get("input", "")
+    payload = request.get_json(silent=True) or {}
+    user_input = payload.get("input") or ""
     # `lang_code="es"` forces the word_based strategy regardless of the
     # session's conjugation language — right for conjugated forms too ("de"
     # would select the compound-number decomposer, which only fits numbers).
@@ -3146,4 +3346,7 @@ def sitemap_xml():
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    # Debug (reloader, template re-stat, no rendered-page cache) is opt-in via
+    # FLASK_DEBUG=1, matching `flask run`, so `python app.py` on a server never
+    # runs the debug build by accident.
+    app.run(debug=os.environ.get("FLASK_DEBUG") == "1")
@@ -0,0 +1,49 @@
+"""Gunicorn settings for the production container.
+
+Gunicorn picks this file up automatically from the working directory
+(/app in the Docker image), so the Dockerfile CMD only names the app.
+"""
+
+import os
+
+bind = "0.0.0.0:5005"
+
+# Requests are short, CPU-light Python plus the odd SQLite / Postgres query or
+# Auth0 round trip. A few threads per process keep one slow outbound call (or a
+# client on a slow connection) from idling the whole worker. WEB_CONCURRENCY /
+# GUNICORN_THREADS override the counts per host without rebuilding the image.
+workers = int(os.environ.get("WEB_CONCURRENCY", "3"))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+# Import the app (translation tables, number dictionaries, compiled regexes)
+# once in the master and fork the workers from it, instead of every worker
+# repeating the import. The app opens no DB connections at import time, so
+# nothing socket-bound is shared across the fork. on_starting below adds the
+# compiled templates.
+preload_app = True
+
+# Tolerate slow Auth0 / DB calls without killing the worker at 30s.
+timeout = 60
+# Give in-flight requests time to finish on SIGTERM.
+graceful_timeout = 30
+
+# Recycle each worker periodically to bound any slow memory leak.
+max_requests = 1000
+max_requests_jitter = 100
+
+# Send gunicorn logs to stdout/stderr so `docker logs` (and Coolify) captures
+# every request and crash.
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    """Load every template in the master before the workers fork.
+
+    Runs after preload_app has imported the app, so this adds no import of its
+    own; only the gunicorn master pays for it, not CLI commands or the tests.
+    """
+    from app import prewarm_templates
+
+    prewarm_templates()
@@ -2,6 +2,7 @@
 
 from .config import (
     AVAILABLE_LANGUAGES,
+    READY_LANGUAGES,
     get_feedback_expression,
     get_language_numbers,
     get_language_ui_description,
@@ -16,6 +17,7 @@ from .config import (
 
 __all__ = [
     "AVAILABLE_LANGUAGES",
+    "READY_LANGUAGES",
     "get_feedback_expression",
     "get_language_numbers",
     "get_language_ui_description",
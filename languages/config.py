@@ -1,5 +1,9 @@
 """Language configuration for diminumero multi-language support."""
 
+import importlib
+from functools import cache
+from types import MappingProxyType
+
 # Available languages with metadata
 AVAILABLE_LANGUAGES = {
     "es": {
@@ -468,47 +472,66 @@ AVAILABLE_LANGUAGES = {
     },
 }
 
+# The registry is static and read by every request across worker threads, so
+# it (and each language's entry) is exposed read-only: add or change a language
+# in the literal above, never at runtime.
+AVAILABLE_LANGUAGES = MappingProxyType(
+    {code: MappingProxyType(info) for code, info in AVAILABLE_LANGUAGES.items()}
+)
 
-def get_languages_with_learn_materials():
-    """Return language codes that have learn materials and are ready."""
-    return [
+
+# Codes of languages that are ready for use. The metadata is static, so the
+# set is built once and every route's language check is a single lookup.
+READY_LANGUAGES = frozenset(
+    code for code, info in AVAILABLE_LANGUAGES.items() if info.get("ready", False)
+)
+
+
+def _ready_languages_with(feature):
+    return tuple(
         code
         for code, info in AVAILABLE_LANGUAGES.items()
-        if info.get("has_learn_materials", False) and info.get("ready", False)
-    ]
+        if info.get(feature, False) and info.get("ready", False)
+    )
+
+
+# Per-feature language codes, in AVAILABLE_LANGUAGES order. Like
+# READY_LANGUAGES they are fixed at import, so the getters below (called on
+# every menu and quiz request) return the same tuple instead of rescanning.
+LEARN_MATERIALS_LANGUAGES = _ready_languages_with("has_learn_materials")
+CONJUGATION_LANGUAGES = _ready_languages_with("has_conjugation")
+CONJUGATION_MATERIALS_LANGUAGES = _ready_languages_with("has_conjugation_materials")
+AUDIO_MODE_LANGUAGES = _ready_languages_with("has_audio_mode")
+
+
+def get_languages_with_learn_materials():
+    """Return language codes that have learn materials and are ready."""
+    return LEARN_MATERIALS_LANGUAGES
 
 
 def get_languages_with_conjugation():
     """Return language codes that have a verb-conjugation practice section and are ready."""
-    return [
-        code
-        for code, info in AVAILABLE_LANGUAGES.items()
-        if info.get("has_conjugation", False) and info.get("ready", False)
-    ]
+    return CONJUGATION_LANGUAGES
 
 
 def get_languages_with_conjugation_materials():
     """Return language codes that have verb-conjugation learn materials and are ready."""
-    return [
-        code
-        for code, info in AVAILABLE_LANGUAGES.items()
-        if info.get("has_conjugation_materials", False) and info.get("ready", False)
-    ]
+    return CONJUGATION_MATERIALS_LANGUAGES
 
 
 def get_languages_with_audio_mode():
     """Return language codes that have a pronunciation audio quiz available."""
-    return [
-        code
-        for code, info in AVAILABLE_LANGUAGES.items()
-        if info.get("has_audio_mode", False) and info.get("ready", False)
-    ]
+    return AUDIO_MODE_LANGUAGES
 
 
+@cache
 def get_language_numbers(lang_code):
     """
     Load and return the NUMBERS dictionary for a specific language.
 
+    Memoised per language code: quiz views call this on every request, and the
+    dictionary is the module-level NUMBERS, shared rather than copied.
+
     Args:
         lang_code: Language code (e.g., 'es', 'ne')
 
@@ -521,42 +544,11 @@ def get_language_numbers(lang_code):
     if not is_language_available(lang_code):
         raise ValueError(f"Language '{lang_code}' is not available")
 
+    # Each language's numbers live in the languages/<code>/ package, so the
+    # code names the module directly.
     try:
-        if lang_code == "es":
-            from .es import NUMBERS
-        elif lang_code == "ne":
-            from .ne import NUMBERS
-        elif lang_code == "de":
-            from .de import NUMBERS
-        elif lang_code == "fr":
-            from .fr import NUMBERS
-        elif lang_code == "da":
-            from .da import NUMBERS
-        elif lang_code == "it":
-            from .it import NUMBERS
-        elif lang_code == "tr":
-            from .tr import NUMBERS
-        elif lang_code == "ko":
-            from .ko import NUMBERS
-        elif lang_code == "no":
-            from .no import NUMBERS
-        elif lang_code == "pt":
-            from .pt import NUMBERS
-        elif lang_code == "sv":
-            from .sv import NUMBERS
-        elif lang_code == "ja":
-            from .ja import NUMBERS
-        elif lang_code == "zh":
-            from .zh import NUMBERS
-        elif lang_code == "cy":
-            from .cy import NUMBERS
-        elif lang_code == "ga":
-            from .ga import NUMBERS
-        else:
-            raise ValueError(f"Language '{lang_code}' is not implemented")
-
-        return NUMBERS
-    except ImportError as e:
+        return importlib.import_module(f".{lang_code}", __package__).NUMBERS
+    except (ImportError, AttributeError) as e:
         raise ValueError(f"Failed to load numbers for language '{lang_code}': {e}")
 
 
@@ -583,9 +575,7 @@ def is_language_ready(lang_code):
     Returns:
         Boolean indicating if language is ready for use
     """
-    return lang_code in AVAILABLE_LANGUAGES and AVAILABLE_LANGUAGES[lang_code].get(
-        "ready", False
-    )
+    return lang_code in READY_LANGUAGES
 
 
 def get_language_info(lang_code):
@@ -596,7 +586,7 @@ def get_language_info(lang_code):
         lang_code: Language code
 
     Returns:
-        Dictionary with language metadata, or None if not found
+        Read-only mapping with language metadata, or None if not found
     """
     return AVAILABLE_LANGUAGES.get(lang_code)
 
@@ -662,10 +652,14 @@ def get_language_ui_description(lang_code, ui_lang):
     return ui_descriptions.get(ui_lang, lang_info.get("description", ""))
 
 
+@cache
 def get_component_decomposer(lang_code):
     """
     Get the component decomposer function for a specific language.
 
+    Memoised per language code, so the deferred import runs once rather than
+    on every answer validated.
+
     Args:
         lang_code: Language code
 
@@ -5,8 +5,10 @@ This script generates German number translations and saves them to numbers.py.
 
 import os
 import random
+from functools import cache
 
 
+@cache
 def number_to_german(n):
     """Convert a number to German."""
     if n == 0:
@@ -96,40 +98,40 @@ def number_to_german(n):
     elif n < 1000000000:
         mill, rest = divmod(n, 1000000)
         if mill == 1:
-            result = "Eine Million"
+            parts = ["Eine Million"]
         else:
-            result = number_to_german(mill) + " Millionen"
+            parts = [number_to_german(mill), "Millionen"]
 
         if rest > 0:
-            result += " " + number_to_german(rest)
-        return result
+            parts.append(number_to_german(rest))
+        return " ".join(parts)
 
     else:
         bill, rest = divmod(n, 1000000000)
         if bill == 1:
-            result = "Eine Milliarde"
+            parts = ["Eine Milliarde"]
         else:
-            result = number_to_german(bill) + " Milliarden"
+            parts = [number_to_german(bill), "Milliarden"]
 
         if rest > 0:
-            result += " " + number_to_german(rest)
-        return result
+            parts.append(number_to_german(rest))
+        return " ".join(parts)
 
 
 # Generate 1000 unique numbers
 random.seed(42)  # For reproducibility
-numbers_set = set()
+numbers = []
 
 # Ensure variety ranges
-numbers_set.update(range(1, 101))
-numbers_set.update(random.sample(range(101, 1001), 200))
-numbers_set.update(random.sample(range(1001, 10001), 300))
-numbers_set.update(random.sample(range(10001, 100001), 200))
-numbers_set.update(random.sample(range(100001, 1000001), 100))
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(range(1, 101))
+numbers.extend(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
 # Generate the dictionary
-NUMBERS = {n: number_to_german(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_german(n) for n in sorted(numbers)}
 
 # Write to numbers.py
 output_dir = "languages/de"
@@ -138,8 +140,7 @@ os.makedirs(output_dir, exist_ok=True)
 with open(f"{output_dir}/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""German numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, german in NUMBERS.items():
-        f.write(f'    {num}: "{german}",\n')
+    f.write("".join(f'    {num}: "{german}",\n' for num, german in NUMBERS.items()))
     f.write("}\n")
 
 print(f"Generated {len(NUMBERS)} German numbers and wrote to {output_dir}/numbers.py")
@@ -9,8 +9,10 @@ To use this as a template for other languages:
 """
 
 import random
+from functools import cache
 
 
+@cache
 def number_to_spanish(n):
     """Convert a number to Spanish."""
     if n == 0:
@@ -98,60 +100,59 @@ def number_to_spanish(n):
         if n == 1000:
             return "mil"
         thousands, rest = divmod(n, 1000)
-        result = (number_to_spanish(thousands) + " mil") if thousands > 1 else "mil"
+        parts = [number_to_spanish(thousands), "mil"] if thousands > 1 else ["mil"]
         if rest:
-            result += " " + number_to_spanish(rest)
-        return result
+            parts.append(number_to_spanish(rest))
+        return " ".join(parts)
     elif n < 1000000000:
         if n == 1000000:
             return "un millón"
         millions, rest = divmod(n, 1000000)
-        result = number_to_spanish(millions) + (
-            " millones" if millions > 1 else " millón"
-        )
+        parts = [number_to_spanish(millions), "millones" if millions > 1 else "millón"]
         if rest:
-            result += " " + number_to_spanish(rest)
-        return result
+            parts.append(number_to_spanish(rest))
+        return " ".join(parts)
     else:
         billions, rest = divmod(n, 1000000000)
-        result = number_to_spanish(billions) + " mil millones"
+        parts = [number_to_spanish(billions), "mil millones"]
         if rest:
-            result += " " + number_to_spanish(rest)
-        return result
+            parts.append(number_to_spanish(rest))
+        return " ".join(parts)
 
 
 # Generate 1000 unique numbers
 random.seed(42)  # For reproducibility
-numbers_set = set()
+# The bands are disjoint and random.sample never repeats, so a plain list
+# holds no duplicates.
+numbers = []
 
 # Include some specific ranges to ensure variety
 # 1-100: 100 numbers
-numbers_set.update(range(1, 101))
+numbers.extend(range(1, 101))
 
 # 101-1000: 200 numbers
-numbers_set.update(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(101, 1001), 200))
 
 # 1001-10000: 300 numbers
-numbers_set.update(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(1001, 10001), 300))
 
 # 10001-100000: 200 numbers
-numbers_set.update(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(10001, 100001), 200))
 
 # 100001-1000000: 100 numbers
-numbers_set.update(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(100001, 1000001), 100))
 
 # Over 1000000: 100 numbers
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
 # Generate the dictionary
-NUMBERS = {n: number_to_spanish(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_spanish(n) for n in sorted(numbers)}
 
 # Write to numbers.py in the same directory
 with open("languages/es/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""Spanish numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, spanish in NUMBERS.items():
-        f.write(f'    {num}: "{spanish}",\n')
+    f.write("".join(f'    {num}: "{spanish}",\n' for num, spanish in NUMBERS.items()))
     f.write("}\n")
 
 print(f"Generated {len(NUMBERS)} Spanish numbers and wrote to languages/es/numbers.py")
@@ -5,8 +5,10 @@ This script generates French number translations and saves them to numbers.py.
 
 import os
 import random
+from functools import cache
 
 
+@cache
 def number_to_french(n):
     """Convert a number to French."""
     if n == 0:
@@ -107,51 +109,51 @@ def number_to_french(n):
     elif n < 1000000:
         th, rest = divmod(n, 1000)
         if th == 1:
-            result = "mille"
+            parts = ["mille"]
         else:
-            result = number_to_french(th) + " mille"
+            parts = [number_to_french(th), "mille"]
 
         if rest > 0:
-            result += " " + number_to_french(rest)
-        return result
+            parts.append(number_to_french(rest))
+        return " ".join(parts)
 
     elif n < 1000000000:
         mill, rest = divmod(n, 1000000)
         if mill == 1:
-            result = "un million"
+            parts = ["un million"]
         else:
-            result = number_to_french(mill) + " millions"
+            parts = [number_to_french(mill), "millions"]
 
         if rest > 0:
-            result += " " + number_to_french(rest)
-        return result
+            parts.append(number_to_french(rest))
+        return " ".join(parts)
 
     else:
         bill, rest = divmod(n, 1000000000)
         if bill == 1:
-            result = "un milliard"
+            parts = ["un milliard"]
         else:
-            result = number_to_french(bill) + " milliards"
+            parts = [number_to_french(bill), "milliards"]
 
         if rest > 0:
-            result += " " + number_to_french(rest)
-        return result
+            parts.append(number_to_french(rest))
+        return " ".join(parts)
 
 
 # Generate 1000 unique numbers
 random.seed(42)  # For reproducibility
-numbers_set = set()
+numbers = []
 
 # Ensure variety across ranges
-numbers_set.update(range(1, 101))
-numbers_set.update(random.sample(range(101, 1001), 200))
-numbers_set.update(random.sample(range(1001, 10001), 300))
-numbers_set.update(random.sample(range(10001, 100001), 200))
-numbers_set.update(random.sample(range(100001, 1000001), 100))
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(range(1, 101))
+numbers.extend(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
 # Generate the dictionary
-NUMBERS = {n: number_to_french(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_french(n) for n in sorted(numbers)}
 
 # Write to numbers.py
 output_dir = "languages/fr"
@@ -160,8 +162,7 @@ os.makedirs(output_dir, exist_ok=True)
 with open(f"{output_dir}/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""French numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, french in NUMBERS.items():
-        f.write(f'    {num}: "{french}",\n')
+    f.write("".join(f'    {num}: "{french}",\n' for num, french in NUMBERS.items()))
     f.write("}\n")
 
 print(f"Generated {len(NUMBERS)} French numbers and wrote to {output_dir}/numbers.py")
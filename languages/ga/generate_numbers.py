@@ -16,8 +16,10 @@ Mutation rules baked into the strings:
 
 import os
 import random
+from functools import cache
 
 
+@cache
 def number_to_irish(n):
     """Convert a non-negative integer to Irish (modern decimal, abstract form)."""
     if n == 0:
@@ -150,24 +152,23 @@ def number_to_irish(n):
 
 # Generate ~1000 unique numbers across magnitude bands
 random.seed(42)
-numbers_set = set()
+numbers = []
 
-numbers_set.update(range(1, 101))
-numbers_set.update(random.sample(range(101, 1001), 200))
-numbers_set.update(random.sample(range(1001, 10001), 300))
-numbers_set.update(random.sample(range(10001, 100001), 200))
-numbers_set.update(random.sample(range(100001, 1000001), 100))
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(range(1, 101))
+numbers.extend(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
-NUMBERS = {n: number_to_irish(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_irish(n) for n in sorted(numbers)}
 
 output_dir = os.path.dirname(os.path.abspath(__file__))
 
 with open(f"{output_dir}/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""Irish numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, irish in NUMBERS.items():
-        f.write(f'    {num}: "{irish}",\n')
+    f.write("".join(f'    {num}: "{irish}",\n' for num, irish in NUMBERS.items()))
     f.write("}\n")
 
 print(f"Generated {len(NUMBERS)} Irish numbers and wrote to {output_dir}/numbers.py")
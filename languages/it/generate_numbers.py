@@ -5,8 +5,10 @@ This script generates Italian number translations and saves them to numbers.py.
 
 import os
 import random
+from functools import cache
 
 
+@cache
 def number_to_italian(n):
     """Convert a number to Italian."""
     if n == 0:
@@ -111,18 +113,18 @@ def number_to_italian(n):
 
 # Generate 1000 unique numbers
 random.seed(42)  # For reproducibility
-numbers_set = set()
+numbers = []
 
 # Ensure variety across ranges
-numbers_set.update(range(1, 101))
-numbers_set.update(random.sample(range(101, 1001), 200))
-numbers_set.update(random.sample(range(1001, 10001), 300))
-numbers_set.update(random.sample(range(10001, 100001), 200))
-numbers_set.update(random.sample(range(100001, 1000001), 100))
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(range(1, 101))
+numbers.extend(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
 # Generate the dictionary
-NUMBERS = {n: number_to_italian(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_italian(n) for n in sorted(numbers)}
 
 # Write to numbers.py
 output_dir = "languages/it"
@@ -131,8 +133,7 @@ os.makedirs(output_dir, exist_ok=True)
 with open(f"{output_dir}/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""Italian numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, italian in NUMBERS.items():
-        f.write(f'    {num}: "{italian}",\n')
+    f.write("".join(f'    {num}: "{italian}",\n' for num, italian in NUMBERS.items()))
     f.write("}\n")
 
 print(f"Generated {len(NUMBERS)} Italian numbers and wrote to {output_dir}/numbers.py")
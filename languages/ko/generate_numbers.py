@@ -8,8 +8,10 @@ Sino-Korean numbers use 만(10000) grouping:
 
 import os
 import random
+from functools import cache
 
 
+@cache
 def number_to_korean(n):
     """Convert a number to Sino-Korean."""
     if n == 0:
@@ -73,18 +75,18 @@ def number_to_korean(n):
 
 # Generate ~1000 unique numbers
 random.seed(42)  # For reproducibility
-numbers_set = set()
+numbers = []
 
 # Ensure variety across ranges
-numbers_set.update(range(1, 101))
-numbers_set.update(random.sample(range(101, 1001), 200))
-numbers_set.update(random.sample(range(1001, 10001), 300))
-numbers_set.update(random.sample(range(10001, 100001), 200))
-numbers_set.update(random.sample(range(100001, 1000001), 100))
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(range(1, 101))
+numbers.extend(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
 # Generate the dictionary
-NUMBERS = {n: number_to_korean(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_korean(n) for n in sorted(numbers)}
 
 # Write to numbers.py
 output_dir = os.path.dirname(os.path.abspath(__file__))
@@ -92,8 +94,7 @@ output_dir = os.path.dirname(os.path.abspath(__file__))
 with open(f"{output_dir}/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""Korean (Sino-Korean) numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, korean in NUMBERS.items():
-        f.write(f'    {num}: "{korean}",\n')
+    f.write("".join(f'    {num}: "{korean}",\n' for num, korean in NUMBERS.items()))
     f.write("}\n")
 
 print(f"Generated {len(NUMBERS)} Korean numbers and wrote to {output_dir}/numbers.py")
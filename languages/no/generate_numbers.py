@@ -8,8 +8,10 @@ Norwegian numbers:
 
 import os
 import random
+from functools import cache
 
 
+@cache
 def number_to_norwegian(n):
     """Convert a number to Norwegian (Bokmål)."""
     if n == 0:
@@ -102,18 +104,18 @@ def number_to_norwegian(n):
 
 # Generate ~1000 unique numbers
 random.seed(42)  # For reproducibility
-numbers_set = set()
+numbers = []
 
 # Ensure variety across ranges
-numbers_set.update(range(1, 101))
-numbers_set.update(random.sample(range(101, 1001), 200))
-numbers_set.update(random.sample(range(1001, 10001), 300))
-numbers_set.update(random.sample(range(10001, 100001), 200))
-numbers_set.update(random.sample(range(100001, 1000001), 100))
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(range(1, 101))
+numbers.extend(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
 # Generate the dictionary
-NUMBERS = {n: number_to_norwegian(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_norwegian(n) for n in sorted(numbers)}
 
 # Write to numbers.py
 output_dir = os.path.dirname(os.path.abspath(__file__))
@@ -121,8 +123,9 @@ output_dir = os.path.dirname(os.path.abspath(__file__))
 with open(f"{output_dir}/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""Norwegian (Bokmål) numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, norwegian in NUMBERS.items():
-        f.write(f'    {num}: "{norwegian}",\n')
+    f.write(
+        "".join(f'    {num}: "{norwegian}",\n' for num, norwegian in NUMBERS.items())
+    )
     f.write("}\n")
 
 print(
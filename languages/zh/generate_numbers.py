@@ -9,6 +9,7 @@ Chinese numbers:
 
 import os
 import random
+from functools import cache
 
 DIGITS = ["零", "一", "二", "三", "四", "五", "六", "七", "八", "九"]
 
@@ -64,6 +65,7 @@ def _under_10000(n, is_leading=True):
     return result
 
 
+@cache
 def number_to_chinese(n):
     """Convert a number to Chinese (Mandarin)."""
     if n == 0:
@@ -89,18 +91,18 @@ def number_to_chinese(n):
 
 # Generate ~1000 unique numbers
 random.seed(42)  # For reproducibility
-numbers_set = set()
+numbers = []
 
 # Ensure variety across ranges
-numbers_set.update(range(1, 101))
-numbers_set.update(random.sample(range(101, 1001), 200))
-numbers_set.update(random.sample(range(1001, 10001), 300))
-numbers_set.update(random.sample(range(10001, 100001), 200))
-numbers_set.update(random.sample(range(100001, 1000001), 100))
-numbers_set.update(random.sample(range(1000001, 10000001), 100))
+numbers.extend(range(1, 101))
+numbers.extend(random.sample(range(101, 1001), 200))
+numbers.extend(random.sample(range(1001, 10001), 300))
+numbers.extend(random.sample(range(10001, 100001), 200))
+numbers.extend(random.sample(range(100001, 1000001), 100))
+numbers.extend(random.sample(range(1000001, 10000001), 100))
 
 # Generate the dictionary
-NUMBERS = {n: number_to_chinese(n) for n in sorted(numbers_set)}
+NUMBERS = {n: number_to_chinese(n) for n in sorted(numbers)}
 
 # Write to numbers.py
 output_dir = os.path.dirname(os.path.abspath(__file__))
@@ -108,8 +110,7 @@ output_dir = os.path.dirname(os.path.abspath(__file__))
 with open(f"{output_dir}/numbers.py", "w", encoding="utf-8") as f:
     f.write('"""Chinese (Mandarin) numbers data for the quiz application."""\n\n')
     f.write("NUMBERS = {\n")
-    for num, chinese in NUMBERS.items():
-        f.write(f'    {num}: "{chinese}",\n')
+    f.write("".join(f'    {num}: "{chinese}",\n' for num, chinese in NUMBERS.items()))
     f.write("}\n")
 
 print(f"Generated {len(NUMBERS)} Chinese numbers and wrote to {output_dir}/numbers.py")
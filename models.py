@@ -1,5 +1,6 @@
 """SQLAlchemy models for diminumero."""
 
+import json
 from datetime import datetime, timezone
 
 from flask_sqlalchemy import SQLAlchemy
@@ -175,10 +176,8 @@ class DeckShare(db.Model):
 
     @property
     def cards(self) -> list[dict]:
-        import json as _json
-
         try:
-            data = _json.loads(self.cards_json or "[]")
+            data = json.loads(self.cards_json or "[]")
         except ValueError:
             return []
         return [c for c in data if isinstance(c, dict) and "front" in c and "back" in c]
@@ -1,8 +1,14 @@
 """Quiz logic for generating questions and validating answers."""
 
+import heapq
+import math
 import random
 import secrets
 import time
+import unicodedata
+from functools import lru_cache
+
+from languages.config import get_component_decomposer, get_validation_strategy
 
 # Seed random with high-resolution time and secrets
 random.seed(secrets.randbits(128) ^ int(time.time() * 1000000))
@@ -12,6 +18,13 @@ random.seed(secrets.randbits(128) ^ int(time.time() * 1000000))
 # Level 5 gives uniform weighting (all sizes equally likely).
 MAGNITUDE_DECAY_FACTORS = {1: 10, 2: 5, 3: 3, 4: 2, 5: 1}
 
+# Per-level multiplier for each magnitude band's sampling key (decay ** band),
+# computed once instead of on every draw.
+_BAND_FACTORS = {
+    level: tuple(decay**band for band in range(5))
+    for level, decay in MAGNITUDE_DECAY_FACTORS.items()
+}
+
 
 def _get_magnitude_band(num):
     """Return the order-of-magnitude band for a number (0-4)."""
@@ -33,44 +46,63 @@ def get_random_question(numbers_dict, exclude_numbers=None, magnitude_level=1):
     The magnitude_level parameter (1-5) controls how aggressively larger numbers
     are down-weighted. Level 1 strongly favors small numbers; level 5 is uniform.
 
+    A one-number draw_question_deck() draw, so both share one sampler. The app
+    no longer calls this: quiz rounds are drawn in one pass with
+    draw_question_deck().
+
     Args:
         numbers_dict: Dictionary mapping numbers to their translations
-        exclude_numbers: List of numbers to exclude (already asked in this session)
+        exclude_numbers: Iterable of numbers to exclude (already asked in this session)
         magnitude_level: Integer 1-5 controlling large-number frequency
 
     Returns:
         Tuple of (number, correct_answer)
     """
-    if exclude_numbers is None:
-        exclude_numbers = []
-
-    available_numbers = [
-        num for num in numbers_dict.keys() if num not in exclude_numbers
-    ]
+    number = draw_question_deck(numbers_dict, 1, magnitude_level, exclude_numbers)[0]
+    return number, numbers_dict[number]
 
-    # If all numbers have been used, reset
-    if not available_numbers:
-        available_numbers = list(numbers_dict.keys())
 
-    # Look up decay factor; invalid levels fall back to 10 (same as level 1)
-    decay = MAGNITUDE_DECAY_FACTORS.get(magnitude_level, 10)
+def draw_question_deck(numbers_dict, count, magnitude_level=1, exclude_numbers=None):
+    """
+    Draw up to `count` distinct numbers for a quiz round in one pass.
 
-    # Calculate weights: weight = (1 / decay) ^ band
-    weights = []
-    for num in available_numbers:
-        band = _get_magnitude_band(num)
-        weight = (1 / decay) ** band if decay > 0 else 1.0
-        weights.append(weight)
+    Same distribution as `count` successive weighted draws that each exclude
+    the earlier ones (weighted sampling without replacement, by
+    Efraimidis-Spirakis keys), but the ~1000-number dictionary is scanned once
+    per round instead of once per question.
 
-    # Re-seed random with fresh entropy for each call
-    random.seed(secrets.randbits(128))
+    Args:
+        numbers_dict: Dictionary mapping numbers to their translations
+        count: Number of questions to draw
+        magnitude_level: Integer 1-5 controlling large-number frequency
+        exclude_numbers: Iterable of numbers to leave out (already asked); if
+            that leaves nothing, every number is drawn from again
 
-    # Use random.choices for weighted selection
-    number = random.choices(available_numbers, weights=weights, k=1)[0]
-    return number, numbers_dict[number]
+    Returns:
+        List of numbers, the next question first
+    """
+    candidates = numbers_dict
+    if exclude_numbers:
+        # Set membership keeps the filter O(1) per candidate instead of
+        # rescanning the asked numbers for each of the ~1000 in the deck.
+        excluded = set(exclude_numbers)
+        candidates = [num for num in numbers_dict if num not in excluded]
+        # If all numbers have been used, reset
+        candidates = candidates or numbers_dict
+
+    # Key = log(u) / weight with weight = (1 / decay) ^ band; the largest keys win.
+    band_factors = _BAND_FACTORS.get(magnitude_level, _BAND_FACTORS[1])
+    rng = random.Random(secrets.randbits(128))
+    return heapq.nlargest(
+        count,
+        candidates,
+        key=lambda num: (
+            math.log(1.0 - rng.random()) * band_factors[_get_magnitude_band(num)]
+        ),
+    )
 
 
-def generate_multiple_choice(numbers_dict, correct_number, correct_answer):
+def generate_multiple_choice(numbers_dict, correct_number, correct_answer, seed=None):
     """
     Generate 4 multiple choice options with one correct answer.
     Uses secrets module for cryptographically secure randomization.
@@ -79,21 +111,33 @@ def generate_multiple_choice(numbers_dict, correct_number, correct_answer):
         numbers_dict: Dictionary mapping numbers to their translations
         correct_number: The number being tested
         correct_answer: The correct translation
+        seed: Optional integer. The same seed always yields the same options in
+            the same order, so a caller can keep the seed instead of the options.
 
     Returns:
         List of 4 options (strings) in truly random order
     """
     digit_length = len(str(correct_number))
-
-    # Filter numbers with same digit length (exclude correct number)
-    same_magnitude_numbers = [
-        (num, answer)
+    # Same digit length as a numeric range, so the scan below compares ints
+    # instead of formatting every number in the dictionary.
+    lower = 10 ** (digit_length - 1) if digit_length > 1 else 0
+    upper = 10**digit_length
+
+    # Answers for numbers with the same digit length (excluding correct number)
+    wrong_answers = [
+        answer
         for num, answer in numbers_dict.items()
-        if num != correct_number and len(str(num)) == digit_length
+        if lower <= num < upper and num != correct_number
     ]
 
-    # Extract only answers
-    wrong_answers = [answer for num, answer in same_magnitude_numbers]
+    if seed is not None:
+        rng = random.Random(seed)
+        all_options = [
+            correct_answer,
+            *rng.sample(wrong_answers, min(3, len(wrong_answers))),
+        ]
+        rng.shuffle(all_options)
+        return all_options
 
     # Use secrets for cryptographically secure random selection
     selected_wrong = []
@@ -131,6 +175,12 @@ def check_answer(user_answer, correct_answer):
     return user_answer == correct_answer
 
 
+# ASCII spellings accepted for German umlauts and ß in normalize_text(). A few
+# str.replace passes beat str.translate here: multi-character replacements
+# push translate onto its slow per-character path.
+GERMAN_REPLACEMENTS = (("ü", "ue"), ("ö", "oe"), ("ä", "ae"), ("ß", "ss"))
+
+
 def normalize_text(text):
     """
     Normalize text for comparison by:
@@ -145,20 +195,12 @@ def normalize_text(text):
     Returns:
         Normalized text
     """
-    import unicodedata
-
     # Convert to lowercase
     text = text.lower().strip()
 
     # Replace German umlauts and ß with ASCII equivalents
     # This allows users to type "fuenf" for "fünf", "oe" for "ö", etc.
-    german_replacements = {
-        "ü": "ue",
-        "ö": "oe",
-        "ä": "ae",
-        "ß": "ss",
-    }
-    for umlaut, replacement in german_replacements.items():
+    for umlaut, replacement in GERMAN_REPLACEMENTS:
         text = text.replace(umlaut, replacement)
 
     # Replace Turkish dotless-i with ASCII i (not decomposed by NFD)
@@ -174,6 +216,31 @@ def normalize_text(text):
     return text
 
 
+# The correct answer stays fixed for a whole question while /api/validate runs
+# on every keystroke, so its normalization and decomposition are memoised.
+@lru_cache(maxsize=4096)
+def _normalized_answer(correct_answer):
+    """normalize_text() of a correct answer."""
+    return normalize_text(correct_answer)
+
+
+@lru_cache(maxsize=4096)
+def _decomposed_answer(correct_answer, lang_code):
+    """
+    Split a correct answer into its components for component-based validation.
+
+    Returns:
+        Tuple of (components, normalized components, their concatenation), or
+        None if the language has no decomposer.
+    """
+    decomposer = get_component_decomposer(lang_code)
+    if not decomposer:
+        return None
+    components = tuple(decomposer(correct_answer))
+    normalized_components = tuple(normalize_text(c) for c in components)
+    return components, normalized_components, "".join(normalized_components)
+
+
 def validate_partial_answer(user_input, correct_answer, lang_code="es"):
     """
     Validate user input against the correct answer with language-aware strategy.
@@ -192,31 +259,22 @@ def validate_partial_answer(user_input, correct_answer, lang_code="es"):
             'words': [{'text': str, 'status': 'correct'|'incorrect'|'incomplete'}]
         }
     """
-    from languages.config import get_validation_strategy, get_component_decomposer
-
     # Normalize both inputs
     normalized_input = normalize_text(user_input)
-    normalized_correct = normalize_text(correct_answer)
+    normalized_correct = _normalized_answer(correct_answer)
 
     # Get validation strategy for this language
     strategy = get_validation_strategy(lang_code)
 
     if strategy == "component_based":
         # Component-based validation (e.g., German compound words)
-        decomposer = get_component_decomposer(lang_code)
+        decomposed = _decomposed_answer(correct_answer, lang_code)
 
-        if not decomposer:
+        if decomposed is None:
             # Fallback to word-based if decomposer not available
             strategy = "word_based"
         else:
-            # Decompose the correct answer into components
-            components = decomposer(correct_answer)
-
-            # Normalize components for matching
-            normalized_components = [normalize_text(c) for c in components]
-
-            # Build the full normalized answer by concatenating components
-            full_normalized = "".join(normalized_components)
+            components, normalized_components, full_normalized = decomposed
 
             # Track position in user input and component list
             word_validations = []
@@ -15,6 +15,10 @@ document.addEventListener('DOMContentLoaded', function() {
 
     // Debounce timer for validation
     let validationTimer = null;
+    // Last input sent for validation. Edits that land back on the same text
+    // (typo + backspace within one debounce window, arrow keys, IME
+    // composition) would get the identical answer, so skip the round trip.
+    let lastValidatedInput = null;
 
     /**
      * Perform live validation via API
@@ -24,11 +28,17 @@ document.addEventListener('DOMContentLoaded', function() {
 
         // Don't validate empty input
         if (!userInput.trim()) {
+            lastValidatedInput = null;
             validationFeedback.innerHTML = '';
             validationFeedback.className = 'validation-feedback';
             return;
         }
 
+        if (userInput === lastValidatedInput) {
+            return;
+        }
+        lastValidatedInput = userInput;
+
         try {
             const response = await fetch('/api/validate', {
                 method: 'POST',
@@ -40,6 +50,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
             if (!response.ok) {
                 console.error('Validation request failed');
+                lastValidatedInput = null;
                 return;
             }
 
@@ -56,6 +67,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
         } catch (error) {
             console.error('Validation error:', error);
+            lastValidatedInput = null;
         }
     }
 
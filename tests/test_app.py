@@ -4,6 +4,7 @@ import pytest
 from app import app as flask_app
 from config import QUESTIONS_PER_QUIZ
 from languages import get_language_numbers
+import quiz_logic
 
 # Load Spanish numbers for testing
 NUMBERS = get_language_numbers("es")
@@ -56,6 +57,20 @@ class TestIndexRoute:
         data = client.get("/").data.decode("utf-8")
         assert "Spanish, Italian and German verb conjugation" in data
 
+    def test_index_cache_follows_ui_language_and_login(self, client):
+        """The cached landing page is keyed per UI language and is never
+        served to a logged-in user."""
+        assert "Learn Numbers &amp; Build" in client.get("/").data.decode("utf-8")
+        with client.session_transaction() as sess:
+            sess["language"] = "de"
+        data = client.get("/").data.decode("utf-8")
+        assert "Zahlen lernen &amp; Vokabelkarten" in data
+        assert "conjugate-lang-modal" not in data
+        with client.session_transaction() as sess:
+            sess["user"] = {"sub": "auth0|user-1", "name": "Ada"}
+        data = client.get("/").data.decode("utf-8")
+        assert "conj-lang-option" in data
+
     def test_learn_conjugations_seo_localized_per_ui_language(self, client):
         """The learn-conjugation SEO keys exist per learn language in every
         UI block that had the old Spanish-only key (no English fallback)."""
@@ -161,6 +176,15 @@ class TestLanguageSwitching:
             # Language should remain unchanged
             assert sess.get("language") == "de"
 
+    def test_switch_to_current_language_leaves_cookie(self, client):
+        """Test that re-selecting the current language doesn't rewrite the session."""
+        with client.session_transaction() as sess:
+            sess["language"] = "de"
+
+        response = client.get("/set_language/de", follow_redirects=False)
+        assert response.status_code in [301, 302]
+        assert "Set-Cookie" not in response.headers
+
 
 class TestStartQuiz:
     """Tests for starting quiz."""
@@ -178,7 +202,7 @@ class TestStartQuiz:
             assert sess.get("learn_language") == "es"
             assert sess.get("score") == 0
             assert sess.get("total_questions") == 0
-            assert sess.get("asked_numbers") == []
+            assert "question_deck" not in sess
 
     def test_start_advanced_mode(self, client):
         """Test starting advanced mode quiz."""
@@ -289,6 +313,73 @@ class TestQuizEasy:
         )
         assert response.status_code == 200
 
+    def test_quiz_easy_draws_round_from_deck(self, client):
+        """Test that questions come off one deck of distinct numbers per round."""
+        client.post("/es/start", data={"mode": "easy"})
+
+        client.get("/es/quiz/easy")
+        with client.session_transaction() as sess:
+            deck = sess["question_deck"]
+            assert sess["current_number"] == deck[0]
+            assert sess["deck_position"] == 1
+        assert len(set(deck)) == QUESTIONS_PER_QUIZ
+
+        client.post("/es/quiz/easy", data={"answer": "x"})
+        client.get("/es/quiz/easy")
+        with client.session_transaction() as sess:
+            assert sess["current_number"] == deck[1]
+            assert sess["question_deck"] == deck
+            assert sess["deck_position"] == 2
+
+    def test_quiz_easy_skipped_answers_keep_deck_bounded(self, client):
+        """Test that skipping past many questions doesn't grow the session."""
+        client.post("/es/start", data={"mode": "easy"})
+
+        for _ in range(QUESTIONS_PER_QUIZ + 5):
+            client.get("/es/quiz/easy")
+            client.post("/es/quiz/easy", data={"answer": ""})
+
+        with client.session_transaction() as sess:
+            assert len(sess["question_deck"]) == QUESTIONS_PER_QUIZ
+            assert sess["total_questions"] == 0
+
+    def test_quiz_easy_redrawn_deck_skips_asked_numbers(self, client, monkeypatch):
+        """Test that a deck redrawn after skipped answers asks new numbers."""
+        excluded = []
+        draw = quiz_logic.draw_question_deck
+
+        def recording_draw(*args, exclude_numbers=None, **kwargs):
+            excluded.append(exclude_numbers)
+            return draw(*args, exclude_numbers=exclude_numbers, **kwargs)
+
+        monkeypatch.setattr(quiz_logic, "draw_question_deck", recording_draw)
+        client.post("/es/start", data={"mode": "easy"})
+
+        asked = []
+        for _ in range(QUESTIONS_PER_QUIZ + 1):
+            client.get("/es/quiz/easy")
+            with client.session_transaction() as sess:
+                asked.append(sess["current_number"])
+            client.post("/es/quiz/easy", data={"answer": ""})
+
+        assert len(set(asked)) == len(asked)
+        assert len(excluded) == 2
+        assert set(excluded[1]) == set(asked[:QUESTIONS_PER_QUIZ])
+
+    def test_quiz_easy_post_after_round_goes_to_results(self, client):
+        """Test that resubmitting after the last question leaves the score alone."""
+        client.post("/es/start", data={"mode": "easy"})
+        with client.session_transaction() as sess:
+            sess["total_questions"] = QUESTIONS_PER_QUIZ
+            sess["score"] = 3
+
+        response = client.post("/es/quiz/easy", data={"answer": "uno"})
+        assert response.status_code == 302
+        assert response.headers["Location"].endswith("/es/results")
+        with client.session_transaction() as sess:
+            assert sess["score"] == 3
+            assert sess["total_questions"] == QUESTIONS_PER_QUIZ
+
     def test_quiz_easy_refresh_same_question(self, client):
         """Test that refreshing the page keeps the same question and options."""
         # Start quiz
@@ -302,7 +393,7 @@ class TestQuizEasy:
         with client.session_transaction() as sess:
             question1 = sess.get("current_number")
             answer1 = sess.get("correct_answer")
-            options1 = sess.get("current_options")
+            seed1 = sess.get("options_seed")
 
         # Refresh the page (GET again without submitting)
         response2 = client.get("/es/quiz/easy")
@@ -312,11 +403,12 @@ class TestQuizEasy:
         with client.session_transaction() as sess:
             question2 = sess.get("current_number")
             answer2 = sess.get("correct_answer")
-            options2 = sess.get("current_options")
+            seed2 = sess.get("options_seed")
 
         assert question1 == question2
         assert answer1 == answer2
-        assert options1 == options2  # Options must be identical
+        assert seed1 is not None and seed1 == seed2
+        assert response1.data == response2.data  # Options must be identical
 
 
 class TestQuizAdvanced:
@@ -389,6 +481,26 @@ class TestQuizAdvanced:
             assert sess.get("current_revealed") is False
             assert "current_number" not in sess
 
+    def test_validate_api_checks_partial_input(self, client):
+        """Live validation reports per-word status for the current question."""
+        client.post("/es/start", data={"mode": "advanced"})
+        client.get("/es/quiz/advanced")
+        with client.session_transaction() as sess:
+            answer = sess.get("correct_answer")
+
+        response = client.post("/api/validate", json={"input": answer})
+        assert response.status_code == 200
+        assert response.get_json()["is_correct"] is True
+
+    def test_validate_api_tolerates_malformed_body(self, client):
+        """A missing or non-JSON body is treated as empty input, not a 4xx."""
+        client.post("/es/start", data={"mode": "advanced"})
+        client.get("/es/quiz/advanced")
+
+        response = client.post("/api/validate", data="not json")
+        assert response.status_code == 200
+        assert response.get_json()["words"] == []
+
 
 class TestResultsPage:
     """Tests for results page."""
@@ -424,6 +536,39 @@ class TestResultsPage:
 
         assert "100 %" in data
 
+    def test_results_speed_bonus_uses_mode_limit(self, client):
+        """Test that the speed bonus follows the quiz mode's time limit."""
+        import time
+
+        from config import SPEED_BONUS_TIME_ADVANCED, SPEED_BONUS_TIME_EASY
+
+        elapsed = (SPEED_BONUS_TIME_EASY + SPEED_BONUS_TIME_ADVANCED) // 2
+        for mode, expected in (("easy", False), ("advanced", True)):
+            with client.session_transaction() as sess:
+                sess["score"] = QUESTIONS_PER_QUIZ
+                sess["learn_language"] = "es"
+                sess["mode"] = mode
+                sess["quiz_start_time"] = int(time.time()) - elapsed
+
+            data = client.get("/es/results").data.decode("utf-8")
+            assert ("Lightning fast!" in data) is expected
+
+    def test_results_try_again_keeps_each_users_mode(self, client):
+        """Test that a cached results page never restarts another user's mode."""
+        for mode, expected_form in (
+            ("easy", 'name="mode" value="easy"'),
+            ("hardcore", 'name="mode" value="hardcore"'),
+            ("audio", "/es/listen/start"),
+        ):
+            with client.session_transaction() as sess:
+                sess["score"] = 5
+                sess["total_questions"] = 5
+                sess["learn_language"] = "es"
+                sess["mode"] = mode
+
+            data = client.get("/es/results").data.decode("utf-8")
+            assert expected_form in data
+
     def test_results_without_language_redirects(self, client):
         """Test that results page redirects without language."""
         with client.session_transaction() as sess:
@@ -471,6 +616,15 @@ class TestLearnPage:
         response = client.get("/es")
         assert b"/es/learn/conjugations" in response.data
 
+    def test_learn_page_revalidates_with_etag(self, client):
+        """Test that a repeat visit to a learn page can get an empty 304."""
+        response = client.get("/es/learn")
+        assert "public" in response.headers["Cache-Control"]
+        etag = response.headers["ETag"]
+
+        response = client.get("/es/learn", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
 
 class TestImprintPage:
     """Tests for imprint page."""
@@ -489,6 +643,113 @@ class TestImprintPage:
         assert "Stefan Wezel" in data or "wezel" in data.lower()
         assert "Tübingen" in data or "tubingen" in data.lower()
 
+    def test_imprint_revalidates_with_etag(self, client):
+        """Test that a matching If-None-Match gets an empty 304."""
+        response = client.get("/imprint")
+        etag = response.headers["ETag"]
+
+        response = client.get("/imprint", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_imprint_follows_ui_language_switch(self, client):
+        """Test that a cached imprint is never served in the previous language."""
+        client.get("/set_language/en")
+        assert "<title>Imprint |" in client.get("/imprint").data.decode("utf-8")
+        client.get("/set_language/de")
+        assert "<title>Impressum |" in client.get("/imprint").data.decode("utf-8")
+
+    def test_imprint_gzipped_when_accepted(self, client):
+        """Test that gzip-capable clients get a compressed, separately tagged body."""
+        import gzip
+
+        plain = client.get("/imprint")
+        assert "Content-Encoding" not in plain.headers
+
+        response = client.get("/imprint", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert gzip.decompress(response.data) == plain.data
+        assert response.headers["ETag"] != plain.headers["ETag"]
+
+        response = client.get(
+            "/imprint",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": response.headers["ETag"],
+            },
+        )
+        assert response.status_code == 304
+
+
+class TestRenderCache:
+    """Tests for the in-process render caches."""
+
+    def test_only_cached_pages_keep_their_gzipped_body(self, client):
+        """Test that per-user bodies are compressed but never cached."""
+        import app as app_module
+
+        app_module._gzipped_shared.cache_clear()
+        client.post("/es/start", data={"mode": "advanced"})
+        response = client.get("/es/quiz/advanced", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert app_module._gzipped_shared.cache_info().currsize == 0
+
+        client.get("/imprint", headers={"Accept-Encoding": "gzip"})
+        assert app_module._gzipped_shared.cache_info().currsize == 1
+
+    def test_spoofed_host_shares_the_cached_page(self, client):
+        """Test that the Host header neither adds cache entries nor leaks in."""
+        import app as app_module
+
+        app_module._render_cached.cache_clear()
+        client.get("/about")
+        response = client.get("/about", headers={"Host": "evil.example"})
+        assert app_module._render_cached.cache_info().currsize == 1
+        body = response.get_data(as_text=True)
+        assert "evil.example" not in body
+        assert app_module.SITE_URL.rstrip("/") + "/static/logo-512.png" in body
+
+    def test_spoofed_host_shares_the_cached_landing_page(self, client):
+        """Test that the Host header adds no landing-page cache entries."""
+        import app as app_module
+
+        app_module._render_index_cached.cache_clear()
+        client.get("/")
+        client.get("/", headers={"X-Forwarded-Host": "evil.example"})
+        assert app_module._render_index_cached.cache_info().currsize == 1
+
+    def test_cached_templates_do_not_read_session_or_request(self, app):
+        """Test that cached pages take per-user values from their context.
+
+        The render caches key on the path and UI/learn language only
+        (what base.html reads); anything else a template read from `session`
+        or `request` would leak from one visitor's page into the next.
+        """
+        from jinja2 import meta, nodes
+
+        import app as app_module
+
+        env = app.jinja_env
+        pending = {
+            "about.html",
+            "imprint.html",
+            "language_selection.html",
+            "privacy.html",
+            "results.html",
+            *app_module.LEARN_TEMPLATES.values(),
+            *app_module.LEARN_CONJUGATIONS_TEMPLATES.values(),
+        }
+        checked = {"base.html"}
+        while pending:
+            name = pending.pop()
+            checked.add(name)
+            source = env.loader.get_source(env, name)[0]
+            ast = env.parse(source)
+            names = {node.name for node in ast.find_all(nodes.Name)}
+            assert not {"session", "request"} & names, name
+            pending |= set(meta.find_referenced_templates(ast)) - checked
+
 
 class TestSecretKeyConfiguration:
     """Tests for secret key configuration."""
@@ -508,3 +769,84 @@ class TestSecretKeyConfiguration:
         import os
 
         assert os.environ.get("FLASK_SECRET_KEY") == test_secret
+
+
+class TestTranslations:
+    """Tests for the UI translation tables."""
+
+    def test_no_repeated_keys_per_ui_language(self):
+        """Test that no UI language's literal repeats a key.
+
+        A repeated key in a dict literal silently overwrites the earlier
+        entry, so this reads translations.py itself rather than the dict.
+        """
+        import ast
+        from pathlib import Path
+
+        source = Path(__file__).parent.parent / "translations.py"
+        tree = ast.parse(source.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Dict):
+                continue
+            keys = [k.value for k in node.keys if isinstance(k, ast.Constant)]
+            repeated = {k for k in keys if keys.count(k) > 1}
+            assert not repeated, f"repeated translation keys: {sorted(repeated)}"
+
+    def test_template_get_text_falls_back_to_key(self, app):
+        """Test that templates see known texts and echo unknown keys back."""
+        from flask import render_template_string
+
+        with app.test_request_context("/"):
+            rendered = render_template_string(
+                "{{ get_text('about_title') }}|{{ get_text('no_such_key') }}"
+            )
+        assert rendered.endswith("|no_such_key")
+        assert not rendered.startswith("about_title|")
+
+    def test_template_get_text_names_the_learn_language(self, app):
+        """Test that templates follow the session's learn language or an override."""
+        from flask import render_template_string, session
+
+        template = (
+            "{{ get_text('home_hero_subtitle') }}|"
+            "{{ get_text('home_hero_subtitle', 'de') }}"
+        )
+        with app.test_request_context("/"):
+            session["learn_language"] = "it"
+            first = render_template_string(template)
+            session["learn_language"] = "fr"
+            second = render_template_string(template)
+
+        assert (
+            first
+            == "Test your Italian number knowledge!|Test your German number knowledge!"
+        )
+        assert second.startswith("Test your French number knowledge!|")
+
+    def test_flash_incorrect_with_other_placeholders(self, app, monkeypatch):
+        """Test that a "{0}" or escaped-brace translation still shows the answer."""
+        from types import MappingProxyType
+
+        from flask import g, get_flashed_messages
+
+        import app as app_module
+
+        for text, expected in (
+            ("Wrong ({0}).", "Wrong (dos)."),
+            ("{{Wrong}}: {}", "{Wrong}: dos"),
+            ("Wrong: {}", "Wrong: dos"),
+        ):
+            monkeypatch.setitem(
+                app_module.UI_TEXTS,
+                "en",
+                MappingProxyType(
+                    {**app_module.UI_TEXTS["en"], "flash_incorrect": text}
+                ),
+            )
+            monkeypatch.setitem(
+                app_module.FLASH_INCORRECT_PARTS, "en", app_module._split_at_slot(text)
+            )
+            with app.test_request_context("/"):
+                g.pop("ui_texts", None)
+                app_module._flash_answer("es", False, "dos")
+                assert get_flashed_messages() == [expected]
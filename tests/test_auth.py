@@ -84,6 +84,22 @@ class TestCallback:
         with client.session_transaction() as sess:
             assert sess["user"] == SAMPLE_USER
 
+    def test_callback_keeps_only_used_claims(self, client, monkeypatch):
+        userinfo = {
+            **SAMPLE_USER,
+            "picture": "https://example.com/ada.png",
+            "nonce": "abc",
+            "iat": 1700000000,
+        }
+        monkeypatch.setattr(
+            app_module.oauth.auth0,
+            "authorize_access_token",
+            lambda: {"userinfo": userinfo},
+        )
+        client.get("/callback")
+        with client.session_transaction() as sess:
+            assert sess["user"] == SAMPLE_USER
+
     def test_callback_oauth_error_redirects_to_index(self, client, monkeypatch):
         from authlib.integrations.base_client.errors import MismatchingStateError
 
@@ -1,7 +1,10 @@
 """Tests for quiz_logic module."""
 
+import pytest
+
 import quiz_logic
 from languages import get_language_numbers
+from languages.de import decompose_german_number
 
 # Load Spanish numbers for testing
 NUMBERS = get_language_numbers("es")
@@ -101,6 +104,49 @@ class TestMagnitudeLevel:
             assert NUMBERS[number] == answer
 
 
+class TestDrawQuestionDeck:
+    """Tests for draw_question_deck function."""
+
+    def test_returns_distinct_valid_numbers(self):
+        """Test that a deck holds the requested count of distinct known numbers."""
+        deck = quiz_logic.draw_question_deck(NUMBERS, 10)
+        assert len(deck) == 10
+        assert len(set(deck)) == 10
+        assert all(number in NUMBERS for number in deck)
+
+    def test_small_pool_returns_everything(self):
+        """Test that asking for more numbers than exist returns them all once."""
+        pool = {1: "uno", 2: "dos", 3: "tres"}
+        assert sorted(quiz_logic.draw_question_deck(pool, 10)) == [1, 2, 3]
+
+    def test_excludes_numbers(self):
+        """Test that excluded numbers are left out of the deck."""
+        pool = {1: "uno", 2: "dos", 3: "tres"}
+        deck = quiz_logic.draw_question_deck(pool, 10, exclude_numbers=[1, 3])
+        assert deck == [2]
+
+    def test_resets_when_all_excluded(self):
+        """Test that excluding every number draws from all of them again."""
+        pool = {1: "uno", 2: "dos", 3: "tres"}
+        deck = quiz_logic.draw_question_deck(pool, 10, exclude_numbers=[1, 2, 3])
+        assert sorted(deck) == [1, 2, 3]
+
+    def test_level_1_favors_small(self):
+        """Test that level 1 decks are mostly small numbers."""
+        numbers = []
+        for _ in range(20):
+            numbers.extend(quiz_logic.draw_question_deck(NUMBERS, 10, 1))
+        small_count = sum(1 for n in numbers if n < 100)
+        assert small_count > len(numbers) * 0.5
+
+    def test_level_5_produces_large_numbers(self):
+        """Test that level 5 (uniform) decks include large numbers."""
+        numbers = []
+        for _ in range(20):
+            numbers.extend(quiz_logic.draw_question_deck(NUMBERS, 10, 5))
+        assert any(n >= 1000 for n in numbers)
+
+
 class TestGenerateMultipleChoice:
     """Tests for generate_multiple_choice function."""
 
@@ -113,6 +159,20 @@ class TestGenerateMultipleChoice:
         )
         assert len(options) == 4
 
+    def test_seed_reproduces_options(self):
+        """Test that a seed always yields the same valid options in the same order."""
+        correct_number = 42
+        correct_answer = NUMBERS[correct_number]
+        options = quiz_logic.generate_multiple_choice(
+            NUMBERS, correct_number, correct_answer, seed=1234
+        )
+        assert len(options) == 4
+        assert len(set(options)) == 4
+        assert correct_answer in options
+        assert options == quiz_logic.generate_multiple_choice(
+            NUMBERS, correct_number, correct_answer, seed=1234
+        )
+
     def test_includes_correct_answer(self):
         """Test that the correct answer is in the options."""
         correct_number = 100
@@ -143,6 +203,17 @@ class TestGenerateMultipleChoice:
         for option in options:
             assert option in all_spanish_numbers
 
+    def test_wrong_options_share_digit_length(self):
+        """Test that wrong options have as many digits as the correct number."""
+        number_by_answer = {answer: num for num, answer in NUMBERS.items()}
+        for correct_number in (5, 10, 99, 100, 1000):
+            correct_answer = NUMBERS[correct_number]
+            options = quiz_logic.generate_multiple_choice(
+                NUMBERS, correct_number, correct_answer
+            )
+            for option in options:
+                assert len(str(number_by_answer[option])) == len(str(correct_number))
+
     def test_randomization(self):
         """Test that options are randomized (not always in same position)."""
         correct_number = 25
@@ -276,9 +347,48 @@ class TestCheckAnswerAdvanced:
         assert quiz_logic.check_answer_advanced("cien", "mil") is False
 
 
+class TestDecomposeGermanNumber:
+    """Tests for the German compound number decomposer."""
+
+    def test_longest_component_wins(self):
+        """Test that "sechzehn" is one component, not "sechs" + "zehn"."""
+        assert decompose_german_number("einhundertsechzehn") == [
+            "ein",
+            "hundert",
+            "sechzehn",
+        ]
+
+    def test_preserves_casing(self):
+        """Test that components keep the casing of the input."""
+        assert decompose_german_number("Siebenundvierzig") == [
+            "Sieben",
+            "und",
+            "vierzig",
+        ]
+
+    def test_skips_unknown_characters(self):
+        """Test that characters outside any component are dropped."""
+        assert decompose_german_number("x-drei") == ["drei"]
+
+    def test_covers_every_german_number(self):
+        """Test that every German number decomposes without losing text."""
+        for text in get_language_numbers("de").values():
+            assert "".join(decompose_german_number(text)) == text.replace(" ", "")
+
+
 class TestNumbersDataIntegrity:
     """Tests for Spanish language numbers data integrity."""
 
+    def test_numbers_loaded_once(self):
+        """Test that repeated loads return the same shared dictionary."""
+        assert get_language_numbers("es") is NUMBERS
+
+    def test_unknown_language_not_cached(self):
+        """Test that an unknown code raises on every call, not just the first."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                get_language_numbers("xx")
+
     def test_numbers_dict_not_empty(self):
         """Test that NUMBERS dictionary is not empty."""
         assert len(NUMBERS) > 0
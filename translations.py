@@ -2250,8 +2250,6 @@ TRANSLATIONS = {
         "quiz_listen_prompt": "Type the number you hear:",
         "audio_numpad_back": "Delete last digit",
         "audio_numpad_submit": "Submit answer",
-        "audio_numpad_back": "Delete last digit",
-        "audio_numpad_submit": "Submit answer",
         "flash_incorrect_audio": "Incorrect. It was {0} ({1}).",
         "flash_audio_missing": "Audio files for this language are not available yet.",
         "seo_title_listen": "Listening - LANGUAGE_NAME_PLACEHOLDER Number Quiz | diminumero",
@@ -2549,8 +2547,6 @@ TRANSLATIONS = {
         "quiz_listen_prompt": "Type the number you hear:",
         "audio_numpad_back": "Delete last digit",
         "audio_numpad_submit": "Submit answer",
-        "audio_numpad_back": "Delete last digit",
-        "audio_numpad_submit": "Submit answer",
         "flash_incorrect_audio": "Incorrect. It was {0} ({1}).",
         "flash_audio_missing": "Audio files for this language are not available yet.",
         "seo_title_listen": "Listening - LANGUAGE_NAME_PLACEHOLDER Number Quiz | diminumero",